@@ -1,15 +1,41 @@
 from __future__ import annotations
 
+import importlib.util
 import os
 
 import uvicorn
 
 
+def _pick_loop() -> str:
+    # uvloop/httptools ship with uvicorn[standard]; fall back for minimal dev installs.
+    return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+
+
+def _pick_http() -> str:
+    return "httptools" if importlib.util.find_spec("httptools") else "h11"
+
+
+def _workers() -> int:
+    # Rate limiter buckets, SSE buses and bridge sync loops are per-process state,
+    # so multiple workers are opt-in via WEB_CONCURRENCY rather than derived from CPU count.
+    try:
+        return max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+    except ValueError:
+        return 1
+
+
 def main() -> None:
     port = int(os.getenv("PORT", "8000"))
-    uvicorn.run("hue_gateway.app:app", host="0.0.0.0", port=port, reload=False)
+    uvicorn.run(
+        "hue_gateway.app:app",
+        host="0.0.0.0",
+        port=port,
+        loop=_pick_loop(),
+        http=_pick_http(),
+        reload=False,
+        workers=_workers(),
+    )
 
 
 if __name__ == "__main__":
     main()
-
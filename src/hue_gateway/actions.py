@@ -1,23 +1,95 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import heapq
+import re
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Any, Awaitable, Callable
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Mapping
+
+import orjson
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - platforms without rapidfuzz wheels
+    fuzz = process = None  # type: ignore[assignment]
 
 from hue_gateway.cache import normalize_name
 from hue_gateway.config import AppConfig
 from hue_gateway.db import Database
-from hue_gateway.hue_client import HueClient, HueTransportError, HueUpstreamError
+from hue_gateway.hue_client import HueClient, HueJSONishResult, HueTransportError, HueUpstreamError
 from hue_gateway.security import AuthContext
 
 
-@dataclass(frozen=True)
+# Success envelope `{"requestId":..,"action":..,"ok":true,"result":..}` assembled from encoded parts.
+_OK_PREFIX = b'{"requestId":'
+_OK_ACTION = b',"action":'
+_OK_RESULT = b',"ok":true,"result":'
+_OK_SUFFIX = b"}"
+
+
 class ActionHTTPResponse:
-    status_code: int
-    body: dict[str, Any]
+    """
+    Dispatch result. Success envelopes are encoded straight to `body_bytes` (orjson);
+    the `body` dict is only built if an in-process caller asks for it.
+    """
+
+    __slots__ = ("status_code", "body_bytes", "_body", "_success")
+
+    def __init__(
+        self,
+        *,
+        status_code: int,
+        body: dict[str, Any] | None = None,
+        body_bytes: bytes | None = None,
+    ) -> None:
+        self.status_code = status_code
+        self.body_bytes = body_bytes
+        self._body = body
+        self._success: tuple[str | None, str, Any] | None = None
+
+    @classmethod
+    def success(cls, request_id: str | None, action: str, result: Any) -> "ActionHTTPResponse":
+        try:
+            body_bytes = b"".join(
+                (
+                    _OK_PREFIX,
+                    orjson.dumps(request_id),
+                    _OK_ACTION,
+                    orjson.dumps(action),
+                    _OK_RESULT,
+                    orjson.dumps(result),
+                    _OK_SUFFIX,
+                )
+            )
+        except orjson.JSONEncodeError:
+            return cls(
+                status_code=200,
+                body={"requestId": request_id, "action": action, "ok": True, "result": result},
+            )
+        resp = cls(status_code=200, body_bytes=body_bytes)
+        resp._success = (request_id, action, result)
+        return resp
+
+    @property
+    def body(self) -> dict[str, Any]:
+        if self._body is None:
+            request_id, action, result = self._success or (None, "", None)
+            self._body = {"requestId": request_id, "action": action, "ok": True, "result": result}
+        return self._body
+
+    def __repr__(self) -> str:
+        return f"ActionHTTPResponse(status_code={self.status_code!r}, body={self.body!r})"
 
 
 class ActionError(Exception):
+    __slots__ = ("status_code", "code", "message", "details", "error_body")
+
     def __init__(
         self,
         *,
@@ -31,25 +103,182 @@ class ActionError(Exception):
         self.code = code
         self.message = message
         self.details = details or {}
+        # Prebuilt `error` object for static errors; shared, so never mutated.
+        self.error_body: dict[str, Any] | None = None
+
+    @classmethod
+    def static(cls, key: str) -> "ActionError":
+        status_code, error_body = _STATIC_ERRORS[key]
+        err = cls(
+            status_code=status_code,
+            code=error_body["code"],
+            message=error_body["message"],
+            details=error_body["details"],
+        )
+        err.error_body = error_body
+        return err
+
+
+def _static_error(status_code: int, code: str, message: str) -> tuple[int, dict[str, Any]]:
+    return status_code, {"code": code, "message": message, "details": {}}
+
+
+# Validation errors whose body never varies; built once and reused by every response.
+_STATIC_ERRORS: Mapping[str, tuple[int, dict[str, Any]]] = MappingProxyType(
+    {
+        "invalid_action": _static_error(400, "invalid_action", "Field 'action' must be a non-empty string"),
+        "invalid_args": _static_error(400, "invalid_args", "Field 'args' must be an object"),
+        "invalid_target": _static_error(400, "invalid_target", "Provide rid or name"),
+        "invalid_rid": _static_error(400, "invalid_rid", "rid must be a string"),
+        "invalid_method": _static_error(400, "invalid_method", "Invalid method"),
+        "invalid_path": _static_error(400, "invalid_path", "path must start with /clip/v2/"),
+        "invalid_path_host": _static_error(400, "invalid_path", "Host override not allowed"),
+        "empty_state": _static_error(400, "empty_state", "No state fields provided"),
+    }
+)
+
+
+def _fast_error(request_id: str | None, action: str, key: str) -> ActionHTTPResponse:
+    status_code, error_body = _STATIC_ERRORS[key]
+    return ActionHTTPResponse(
+        status_code=status_code,
+        body={"requestId": request_id, "action": action, "ok": False, "error": error_body},
+    )
+
+
+_CLIPV2_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"})
+_CLIPV2_RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# A /clip/v2/ path with no scheme (host override) or parent traversal anywhere after the prefix.
+_CLIPV2_PATH_RE = re.compile(r"/clip/v2/(?:(?!://|\.\.).)*\Z", re.DOTALL)
+
+_MISSING = object()
+
+_BRIGHTNESS_MIN = 0.1
+_BRIGHTNESS_MAX = 100.0
+
+
+@functools.lru_cache(maxsize=64)
+def _k_to_mirek(k: float) -> int:
+    # Clients use a handful of colour temperatures (2200K, 2700K, 6500K, ...), so this hits.
+    return int(round(1_000_000 / k))
+
+
+def _from_transport_error(err: HueTransportError) -> ActionError:
+    return ActionError(
+        status_code=424,
+        code="bridge_unreachable",
+        message="Hue Bridge unreachable",
+        details={"error": str(err)},
+    )
+
+
+def _from_upstream_error(err: HueUpstreamError) -> ActionError:
+    rate_limited = err.status_code == 429
+    return ActionError(
+        status_code=429 if rate_limited else 502,
+        code="bridge_rate_limited" if rate_limited else "bridge_error",
+        message="Hue Bridge returned an error",
+        details={"status": err.status_code, "body": err.body},
+    )
+
+
+def _from_unexpected_error(err: Exception) -> ActionError:
+    return ActionError(status_code=500, code="internal_error", message=str(err))
+
+
+# Exception type -> ActionError converter for dispatch(); subclasses resolve via their MRO.
+_EXC_TABLE: dict[type[BaseException], Callable[[Any], ActionError]] = {
+    ActionError: lambda err: err,
+    HueTransportError: _from_transport_error,
+    HueUpstreamError: _from_upstream_error,
+}
+
+
+def _to_action_error(err: Exception) -> ActionError:
+    convert = _EXC_TABLE.get(type(err))
+    if convert is None:
+        convert = next((_EXC_TABLE[t] for t in type(err).__mro__ if t in _EXC_TABLE), _from_unexpected_error)
+    return convert(err)
+
+
+def _status_body(result: HueJSONishResult) -> dict[str, Any]:
+    # Shared result shape of the bridge-call actions: the bridge status code and its (JSON-ish) body.
+    return {"status": result.status_code, "body": result.body}
+
+
+# Below this many candidates, scoring is cheaper than a thread handoff.
+_SCORE_IN_THREAD_MIN_CANDIDATES = 500
+
+
+def _score_top5(query: str, choices: list[str]) -> list[tuple[str, float, int]]:
+    if process is not None:
+        return process.extract(query, choices, scorer=fuzz.ratio, limit=5)
+    # Pure-Python fallback with the same (choice, score 0-100, index) shape.
+    scored = (
+        (choice, SequenceMatcher(None, query, choice).ratio() * 100.0, idx) for idx, choice in enumerate(choices)
+    )
+    return heapq.nlargest(5, scored, key=itemgetter(1))
 
 
 Handler = Callable[[str | None, dict[str, Any], AuthContext], Awaitable[dict[str, Any]]]
+NameCandidates = list[tuple[str, str, str | None]]
+
+_NAME_CACHE_MAX_RTYPES = 16
+_RESOLVE_CACHE_MAX_ENTRIES = 128
+
+
+@dataclass(frozen=True, slots=True)
+class _NameIndex:
+    candidates: NameCandidates
+    choices: list[str]
+    # name_norm -> [(rid, display_name), ...]; more than one entry means duplicate names.
+    exact: dict[str, list[tuple[str, str | None]]]
+
+    @classmethod
+    def build(cls, candidates: NameCandidates) -> "_NameIndex":
+        exact: dict[str, list[tuple[str, str | None]]] = {}
+        for cand_norm, rid, display_name in candidates:
+            exact.setdefault(cand_norm, []).append((rid, display_name))
+        return cls(candidates=candidates, choices=[c[0] for c in candidates], exact=exact)
 
 
 class ActionDispatcher:
-    def __init__(self, *, db: Database, hue: HueClient, config: AppConfig) -> None:
+    __slots__ = ("db", "hue", "config", "config_changed", "_cand_cache", "_resolve_cache", "_bridge_sem")
+
+    # action -> handler method name; resolved with getattr so the table is shared across instances.
+    _HANDLERS: Mapping[str, str] = MappingProxyType(
+        {
+            "bridge.set_host": "_bridge_set_host",
+            "bridge.pair": "_bridge_pair",
+            "clipv2.request": "_clipv2_request",
+            "resolve.by_name": "_resolve_by_name",
+            "light.set": "_light_set",
+            "grouped_light.set": "_grouped_light_set",
+            "scene.activate": "_scene_activate",
+        }
+    )
+
+    def __init__(
+        self,
+        *,
+        db: Database,
+        hue: HueClient,
+        config: AppConfig,
+        config_changed: asyncio.Event | None = None,
+    ) -> None:
         self.db = db
         self.hue = hue
         self.config = config
-        self._handlers: dict[str, Handler] = {
-            "bridge.set_host": self._bridge_set_host,
-            "bridge.pair": self._bridge_pair,
-            "clipv2.request": self._clipv2_request,
-            "resolve.by_name": self._resolve_by_name,
-            "light.set": self._light_set,
-            "grouped_light.set": self._grouped_light_set,
-            "scene.activate": self._scene_activate,
-        }
+        # Set after bridge settings are persisted so the app's bootstrap loop reconfigures.
+        self.config_changed = config_changed
+        # rtype -> (expires_at_monotonic, index); bounded LRU over rtypes.
+        self._cand_cache: OrderedDict[str, tuple[float, _NameIndex]] = OrderedDict()
+        # (rtype, raw name) -> (expires_at_monotonic, resolved); successful resolutions only.
+        self._resolve_cache: OrderedDict[tuple[str, str], tuple[float, ActionDispatcher._ResolvedName]] = (
+            OrderedDict()
+        )
+        # Bounds in-flight bridge calls so bursts queue here instead of tripping bridge 429s + retries.
+        self._bridge_sem = asyncio.Semaphore(max(1, config.bridge_max_concurrency))
 
     async def dispatch(self, *, payload: dict[str, Any], auth: AuthContext) -> ActionHTTPResponse:
         request_id = payload.get("requestId")
@@ -57,28 +286,12 @@ class ActionDispatcher:
         args = payload.get("args") or {}
 
         if not isinstance(action, str) or not action:
-            return self._error_response(
-                request_id=request_id,
-                action="",
-                err=ActionError(
-                    status_code=400,
-                    code="invalid_action",
-                    message="Field 'action' must be a non-empty string",
-                ),
-            )
+            return _fast_error(request_id, "", "invalid_action")
         if not isinstance(args, dict):
-            return self._error_response(
-                request_id=request_id,
-                action=action,
-                err=ActionError(
-                    status_code=400,
-                    code="invalid_args",
-                    message="Field 'args' must be an object",
-                ),
-            )
+            return _fast_error(request_id, action, "invalid_args")
 
-        handler = self._handlers.get(action)
-        if not handler:
+        handler_name = self._HANDLERS.get(action)
+        if handler_name is None:
             return self._error_response(
                 request_id=request_id,
                 action=action,
@@ -89,44 +302,12 @@ class ActionDispatcher:
                 ),
             )
 
+        handler: Handler = getattr(self, handler_name)
         try:
             result = await handler(request_id, args, auth)
-            return ActionHTTPResponse(
-                status_code=200,
-                body={"requestId": request_id, "action": action, "ok": True, "result": result},
-            )
-        except ActionError as err:
-            return self._error_response(request_id=request_id, action=action, err=err)
-        except HueTransportError as err:
-            return self._error_response(
-                request_id=request_id,
-                action=action,
-                err=ActionError(
-                    status_code=424,
-                    code="bridge_unreachable",
-                    message="Hue Bridge unreachable",
-                    details={"error": str(err)},
-                ),
-            )
-        except HueUpstreamError as err:
-            status_code = 429 if err.status_code == 429 else 502
-            code = "bridge_rate_limited" if err.status_code == 429 else "bridge_error"
-            return self._error_response(
-                request_id=request_id,
-                action=action,
-                err=ActionError(
-                    status_code=status_code,
-                    code=code,
-                    message="Hue Bridge returned an error",
-                    details={"status": err.status_code, "body": err.body},
-                ),
-            )
+            return ActionHTTPResponse.success(request_id, action, result)
         except Exception as err:
-            return self._error_response(
-                request_id=request_id,
-                action=action,
-                err=ActionError(status_code=500, code="internal_error", message=str(err)),
-            )
+            return self._error_response(request_id=request_id, action=action, err=_to_action_error(err))
 
     @staticmethod
     def _error_response(*, request_id: str | None, action: str, err: ActionError) -> ActionHTTPResponse:
@@ -134,7 +315,7 @@ class ActionDispatcher:
             "requestId": request_id,
             "action": action,
             "ok": False,
-            "error": {"code": err.code, "message": err.message, "details": err.details},
+            "error": err.error_body or {"code": err.code, "message": err.message, "details": err.details},
         }
         return ActionHTTPResponse(status_code=err.status_code, body=body)
 
@@ -143,7 +324,8 @@ class ActionDispatcher:
         if not isinstance(devicetype, str):
             raise ActionError(status_code=400, code="invalid_devicetype", message="devicetype must be a string")
 
-        response = await self.hue.post_json("/api", json_body={"devicetype": devicetype})
+        async with self._bridge_sem:
+            response = await self.hue.post_json("/api", json_body={"devicetype": devicetype})
         # Expected Hue v1-style response: list of {"success": {"username": ...}} or {"error": {...}}
         if isinstance(response, list) and response:
             first = response[0]
@@ -167,6 +349,9 @@ class ActionDispatcher:
                     application_key = success["username"]
                     await self.db.set_setting("application_key", application_key)
                     self.hue.configure(bridge_host=self.hue.bridge_host, application_key=application_key)
+                    self.invalidate_name_cache()
+                    if self.config_changed is not None:
+                        self.config_changed.set()
                     return {"applicationKey": application_key, "stored": True}
 
         raise ActionError(
@@ -190,6 +375,9 @@ class ActionDispatcher:
 
         await self.db.set_setting("bridge_host", host)
         self.hue.configure(bridge_host=host, application_key=self.hue.application_key)
+        self.invalidate_name_cache()
+        if self.config_changed is not None:
+            self.config_changed.set()
         return {"bridgeHost": host, "stored": True}
 
     async def _clipv2_request(self, request_id: str | None, args: dict[str, Any], _: AuthContext):
@@ -197,14 +385,12 @@ class ActionDispatcher:
         path = args.get("path")
         body = args.get("body")
 
-        if method not in {"GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"}:
-            raise ActionError(status_code=400, code="invalid_method", message="Invalid method")
-        if not isinstance(path, str) or not path.startswith("/clip/v2/"):
-            raise ActionError(
-                status_code=400, code="invalid_path", message="path must start with /clip/v2/"
-            )
-        if path.startswith("//") or "://" in path or ".." in path:
-            raise ActionError(status_code=400, code="invalid_path", message="Host override not allowed")
+        if method not in _CLIPV2_METHODS:
+            raise ActionError.static("invalid_method")
+        if not isinstance(path, str) or not _CLIPV2_PATH_RE.match(path):
+            if isinstance(path, str) and path.startswith("/clip/v2/"):
+                raise ActionError.static("invalid_path_host")
+            raise ActionError.static("invalid_path")
 
         json_body = None
         if body is not None:
@@ -212,16 +398,17 @@ class ActionDispatcher:
                 raise ActionError(status_code=400, code="invalid_body", message="body must be JSON object/array")
             json_body = body
 
-        retry = method in {"GET", "HEAD", "OPTIONS"}
-        result = await self.hue.request_jsonish(
-            method=method,
-            path=path,
-            json_body=json_body,
-            retry=retry,
-            max_attempts=self.config.retry_max_attempts,
-            base_delay_ms=self.config.retry_base_delay_ms,
-        )
-        return {"status": result.status_code, "body": result.body}
+        retry = method in _CLIPV2_RETRY_METHODS
+        async with self._bridge_sem:
+            result = await self.hue.request_jsonish(
+                method=method,
+                path=path,
+                json_body=json_body,
+                retry=retry,
+                max_attempts=self.config.retry_max_attempts,
+                base_delay_ms=self.config.retry_base_delay_ms,
+            )
+        return _status_body(result)
 
     async def _resolve_by_name(self, request_id: str | None, args: dict[str, Any], _: AuthContext):
         rtype = args.get("rtype")
@@ -237,33 +424,91 @@ class ActionDispatcher:
             "confidence": matched.confidence,
         }
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class _ResolvedName:
         rid: str
         name: str | None
         confidence: float
 
+    def invalidate_name_cache(self) -> None:
+        self._cand_cache.clear()
+        self._resolve_cache.clear()
+
+    async def _name_index(self, rtype: str) -> _NameIndex:
+        now = time.monotonic()
+        entry = self._cand_cache.get(rtype)
+        if entry is not None and now < entry[0]:
+            self._cand_cache.move_to_end(rtype)
+            return entry[1]
+
+        index = _NameIndex.build(await self.db.list_name_candidates(rtype=rtype))
+        ttl = self.config.name_cache_ttl_seconds
+        if ttl > 0:
+            self._cand_cache[rtype] = (now + ttl, index)
+            self._cand_cache.move_to_end(rtype)
+            while len(self._cand_cache) > _NAME_CACHE_MAX_RTYPES:
+                self._cand_cache.popitem(last=False)
+        return index
+
     async def _resolve_name(self, *, rtype: str, name: str) -> "_ResolvedName":
+        key = (rtype, name)
+        now = time.monotonic()
+        entry = self._resolve_cache.get(key)
+        if entry is not None and now < entry[0]:
+            self._resolve_cache.move_to_end(key)
+            return entry[1]
+
+        resolved = await self._resolve_name_uncached(rtype=rtype, name=name)
+        ttl = self.config.resolve_cache_ttl_seconds
+        if ttl > 0:
+            self._resolve_cache[key] = (now + ttl, resolved)
+            self._resolve_cache.move_to_end(key)
+            while len(self._resolve_cache) > _RESOLVE_CACHE_MAX_ENTRIES:
+                self._resolve_cache.popitem(last=False)
+        return resolved
+
+    async def _resolve_name_uncached(self, *, rtype: str, name: str) -> "_ResolvedName":
         query = normalize_name(name)
-        candidates = await self.db.list_name_candidates(rtype=rtype)
+        index = await self._name_index(rtype)
+        candidates = index.candidates
         if not candidates:
             raise ActionError(status_code=404, code="not_found", message=f"No resources for rtype={rtype}")
 
-        scored: list[tuple[float, str, str | None, str]] = []
-        for cand_norm, rid, display_name in candidates:
-            score = SequenceMatcher(None, query, cand_norm).ratio()
-            scored.append((score, rid, display_name, cand_norm))
-        scored.sort(key=lambda x: x[0], reverse=True)
+        exact = index.exact.get(query)
+        if exact is not None:
+            if len(exact) == 1:
+                rid, display_name = exact[0]
+                return self._ResolvedName(rid=rid, name=display_name, confidence=1.0)
+            raise ActionError(
+                status_code=409,
+                code="ambiguous_name",
+                message=f"Multiple matches for {rtype} name",
+                details={
+                    "candidates": [
+                        {"rid": rid, "name": display_name, "confidence": 1.0}
+                        for rid, display_name in exact[:5]
+                    ]
+                },
+            )
 
-        best_score, best_rid, best_name, _ = scored[0]
+        # rapidfuzz returns (choice, score 0-100, index), best first; scale to keep confidence in [0, 1].
+        if len(index.choices) >= _SCORE_IN_THREAD_MIN_CANDIDATES:
+            matches = await asyncio.to_thread(_score_top5, query, index.choices)
+        else:
+            matches = _score_top5(query, index.choices)
+        top: list[tuple[float, str, str | None, str]] = []
+        for cand_norm, score, idx in matches:
+            _, rid, display_name = candidates[idx]
+            top.append((score / 100.0, rid, display_name, cand_norm))
+
+        best_score, best_rid, best_name, _ = top[0]
         if best_score >= self.config.fuzzy_match_autopick_threshold:
             return self._ResolvedName(rid=best_rid, name=best_name, confidence=best_score)
 
-        second_score = scored[1][0] if len(scored) > 1 else 0.0
+        second_score = top[1][0] if len(top) > 1 else 0.0
         if best_score >= self.config.fuzzy_match_threshold and (best_score - second_score) >= self.config.fuzzy_match_margin:
             return self._ResolvedName(rid=best_rid, name=best_name, confidence=best_score)
 
-        top = scored[:5]
         raise ActionError(
             status_code=409,
             code="ambiguous_name",
@@ -276,83 +521,78 @@ class ActionDispatcher:
             },
         )
 
-    async def _light_set(self, request_id: str | None, args: dict[str, Any], _: AuthContext):
+    async def _require_rid(self, rtype: str, args: dict[str, Any]) -> str:
         rid = args.get("rid")
-        name = args.get("name")
-        if rid is None and name is None:
-            raise ActionError(status_code=400, code="invalid_target", message="Provide rid or name")
         if rid is None:
-            resolved = await self._resolve_name(rtype="light", name=str(name))
-            rid = resolved.rid
+            name = args.get("name")
+            if name is None:
+                raise ActionError.static("invalid_target")
+            rid = (await self._resolve_name(rtype=rtype, name=str(name))).rid
         if not isinstance(rid, str) or not rid:
-            raise ActionError(status_code=400, code="invalid_rid", message="rid must be a string")
+            raise ActionError.static("invalid_rid")
+        return rid
+
+    async def _light_set(self, request_id: str | None, args: dict[str, Any], _: AuthContext):
+        rid = await self._require_rid("light", args)
         payload = self._build_light_payload(args)
-        result = await self.hue.request_jsonish(method="PUT", path=f"/clip/v2/resource/light/{rid}", json_body=payload)
-        return {"status": result.status_code, "body": result.body}
+        async with self._bridge_sem:
+            result = await self.hue.request_jsonish(
+                method="PUT", path=f"/clip/v2/resource/light/{rid}", json_body=payload
+            )
+        return _status_body(result)
 
     async def _grouped_light_set(self, request_id: str | None, args: dict[str, Any], _: AuthContext):
-        rid = args.get("rid")
-        name = args.get("name")
-        if rid is None and name is None:
-            raise ActionError(status_code=400, code="invalid_target", message="Provide rid or name")
-        if rid is None:
-            resolved = await self._resolve_name(rtype="grouped_light", name=str(name))
-            rid = resolved.rid
-        if not isinstance(rid, str) or not rid:
-            raise ActionError(status_code=400, code="invalid_rid", message="rid must be a string")
+        rid = await self._require_rid("grouped_light", args)
         payload = self._build_light_payload(args)
-        result = await self.hue.request_jsonish(
-            method="PUT", path=f"/clip/v2/resource/grouped_light/{rid}", json_body=payload
-        )
-        return {"status": result.status_code, "body": result.body}
+        async with self._bridge_sem:
+            result = await self.hue.request_jsonish(
+                method="PUT", path=f"/clip/v2/resource/grouped_light/{rid}", json_body=payload
+            )
+        return _status_body(result)
 
     def _build_light_payload(self, args: dict[str, Any]) -> dict[str, Any]:
         payload: dict[str, Any] = {}
 
-        if "on" in args:
-            on_val = args.get("on")
+        # Each field is read once; `on` is validated whenever present, the others only when non-null.
+        on_val = args.get("on", _MISSING)
+        if on_val is not _MISSING:
             if not isinstance(on_val, bool):
                 raise ActionError(status_code=400, code="invalid_on", message="on must be boolean")
             payload["on"] = {"on": on_val}
 
-        if "brightness" in args and args.get("brightness") is not None:
-            b = args.get("brightness")
+        b = args.get("brightness")
+        if b is not None:
             if not isinstance(b, (int, float)):
                 raise ActionError(status_code=400, code="invalid_brightness", message="brightness must be number")
-            brightness = max(0.1, min(100.0, float(b)))
-            payload["dimming"] = {"brightness": brightness}
+            payload["dimming"] = {"brightness": max(_BRIGHTNESS_MIN, min(_BRIGHTNESS_MAX, float(b)))}
 
-        if "colorTempK" in args and args.get("colorTempK") is not None:
-            k = args.get("colorTempK")
+        k = args.get("colorTempK")
+        if k is not None:
             if not isinstance(k, (int, float)) or k <= 0:
                 raise ActionError(status_code=400, code="invalid_colorTempK", message="colorTempK must be positive")
-            mirek = int(round(1_000_000 / float(k)))
-            payload["color_temperature"] = {"mirek": mirek}
+            payload["color_temperature"] = {"mirek": _k_to_mirek(float(k))}
 
-        if "xy" in args and args.get("xy") is not None:
-            xy = args.get("xy")
-            if not isinstance(xy, dict) or "x" not in xy or "y" not in xy:
+        xy = args.get("xy")
+        if xy is not None:
+            if not isinstance(xy, dict):
+                raise ActionError(status_code=400, code="invalid_xy", message="xy must be {x,y}")
+            x = xy.get("x", _MISSING)
+            y = xy.get("y", _MISSING)
+            if x is _MISSING or y is _MISSING:
                 raise ActionError(status_code=400, code="invalid_xy", message="xy must be {x,y}")
-            x = xy.get("x")
-            y = xy.get("y")
             if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
                 raise ActionError(status_code=400, code="invalid_xy", message="xy.x and xy.y must be numbers")
             payload["color"] = {"xy": {"x": float(x), "y": float(y)}}
 
         if not payload:
-            raise ActionError(status_code=400, code="empty_state", message="No state fields provided")
+            raise ActionError.static("empty_state")
         return payload
 
     async def _scene_activate(self, request_id: str | None, args: dict[str, Any], _: AuthContext):
-        rid = args.get("rid")
-        name = args.get("name")
-        if rid is None and name is None:
-            raise ActionError(status_code=400, code="invalid_target", message="Provide rid or name")
-        if rid is None:
-            resolved = await self._resolve_name(rtype="scene", name=str(name))
-            rid = resolved.rid
-        if not isinstance(rid, str) or not rid:
-            raise ActionError(status_code=400, code="invalid_rid", message="rid must be a string")
+        rid = await self._require_rid("scene", args)
         payload = {"recall": {"action": "active"}}
-        result = await self.hue.request_jsonish(method="PUT", path=f"/clip/v2/resource/scene/{rid}", json_body=payload)
-        return {"status": result.status_code, "body": result.body}
+        async with self._bridge_sem:
+            result = await self.hue.request_jsonish(
+                method="PUT", path=f"/clip/v2/resource/scene/{rid}", json_body=payload
+            )
+        return _status_body(result)
@@ -6,12 +6,14 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from dataclasses import replace
 
-import json
 import logging
 import time
 from typing import Callable
 
-from fastapi import Body, Depends, FastAPI, Request, Response, status
+import orjson
+from pydantic import ValidationError
+
+from fastapi import Depends, FastAPI, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
 from fastapi.responses import StreamingResponse
@@ -20,13 +22,24 @@ from hue_gateway.actions import ActionDispatcher
 from hue_gateway.cache import ResourceCache
 from hue_gateway.config import AppConfig
 from hue_gateway.db import Database
-from hue_gateway.event_hub import EventHub
+from hue_gateway.docs import (
+    ACTIONS_DESCRIPTION,
+    ACTIONS_EXAMPLES,
+    APP_DESCRIPTION,
+    EVENTS_STREAM_DESCRIPTION,
+    READYZ_DESCRIPTION,
+)
+from hue_gateway.event_hub import EventHub, sse_data_frame
 from hue_gateway.hue_client import HueClient
 from hue_gateway.hue_client import HueTransportError, HueUpstreamError
 from hue_gateway.hue_sync import resync_loop, sse_ingest_loop, sync_core_resources
 from hue_gateway.openapi_custom import install_custom_openapi
 from hue_gateway.rate_limit import TokenBucketLimiter
+from hue_gateway.responses import ORJSONResponse
 from hue_gateway.security import AuthContext, require_auth
+from hue_gateway.v2.event_bus import V2EventBus
+from hue_gateway.v2.event_forwarder import forward_v1_to_v2_loop as _forward_v1_to_v2_loop
+from hue_gateway.v2.idempotency import cleanup_loop as _idempotency_cleanup_loop
 from hue_gateway.schemas import (
     ActionRequest,
     ActionResponse,
@@ -34,10 +47,26 @@ from hue_gateway.schemas import (
     RateLimitedResponse,
     ReadinessResponse,
     UnauthorizedResponse,
+    parse_action_request,
 )
 
 
-@dataclass
+_BOOTSTRAP_RECHECK_SECONDS = 60.0
+# Readiness probes must answer fast and not fan out to the bridge on every call.
+_READYZ_TIMEOUT_SECONDS = 1.5
+_READYZ_OK_TTL_SECONDS = 1.0
+# Same bytes the response_model would produce, encoded once instead of revalidated per probe.
+_READY_OK_BODY = orjson.dumps(ReadinessResponse(ready=True).model_dump())
+# Liveness is a constant; model_construct skips validation of a value we produce ourselves.
+_HEALTH_OK_BODY = orjson.dumps(HealthResponse.model_construct(ok=True).model_dump())
+
+
+def _ready_ok_response() -> Response:
+    # A fresh Response per call: middleware may add headers, so instances are not shared.
+    return Response(content=_READY_OK_BODY, media_type="application/json")
+
+
+@dataclass(slots=True)
 class AppState:
     config: AppConfig
     db: Database
@@ -47,9 +76,12 @@ class AppState:
     dispatcher: ActionDispatcher
     cache: ResourceCache
     hub: EventHub
-    v2_bus: "V2EventBus"
+    v2_bus: V2EventBus
     limiter: TokenBucketLimiter
     tasks: list[asyncio.Task]
+    config_changed: asyncio.Event
+    # Monotonic deadline until which a successful bridge ping is reused by /readyz.
+    ready_until: float = 0.0
 
 
 def _default_db_path() -> str:
@@ -69,6 +101,14 @@ def _default_db_path() -> str:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Python 3.12+: tasks start running inline up to their first real suspension, so the many
+    # short ones (publishes, cached reads, per-ref fetches) skip a scheduler round-trip.
+    loop = asyncio.get_running_loop()
+    previous_task_factory = loop.get_task_factory()
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+
     config = AppConfig.from_env()
     db_path = _default_db_path()
     db = Database(db_path=db_path)
@@ -87,11 +127,10 @@ async def lifespan(app: FastAPI):
         bridge_host=config.bridge_host,
         application_key=config.application_key,
     )
-    dispatcher = ActionDispatcher(db=db, hue=hue, config=config)
+    config_changed = asyncio.Event()
+    dispatcher = ActionDispatcher(db=db, hue=hue, config=config, config_changed=config_changed)
     cache = ResourceCache()
-    hub = EventHub()
-    from hue_gateway.v2.event_bus import V2EventBus
-
+    hub = EventHub(max_queue_size=config.event_queue_max)
     v2_bus = V2EventBus(replay_maxlen=500)
     limiter = TokenBucketLimiter(rate_per_sec=config.rate_limit_rps, burst=config.rate_limit_burst)
 
@@ -109,21 +148,31 @@ async def lifespan(app: FastAPI):
         v2_bus=v2_bus,
         limiter=limiter,
         tasks=tasks,
+        config_changed=config_changed,
     )
 
     # Housekeeping for v2 idempotency records (no-op until v2 uses them).
-    from hue_gateway.v2.idempotency import cleanup_loop as _idempotency_cleanup_loop
-
     tasks.append(asyncio.create_task(_idempotency_cleanup_loop(db=db)))
 
     # Feed v2 SSE from the existing bridge ingestion hub.
-    from hue_gateway.v2.event_forwarder import forward_v1_to_v2_loop as _forward_v1_to_v2_loop
-
     tasks.append(asyncio.create_task(_forward_v1_to_v2_loop(db=db, cache=cache, hub=hub, bus=v2_bus)))
 
     async def bootstrap_loop() -> None:
         started = False
+        # Run the initial configuration immediately.
+        config_changed.set()
         while True:
+            # bridge.set_host / bridge.pair set the event; the timeout is only a slow
+            # fallback for settings written by another worker process.
+            # asyncio.timeout() rather than wait_for(): on 3.11 wait_for can swallow a shutdown
+            # cancel that lands as the event fires, leaving lifespan waiting on this task.
+            try:
+                async with asyncio.timeout(_BOOTSTRAP_RECHECK_SECONDS):
+                    await config_changed.wait()
+            except TimeoutError:
+                pass
+            config_changed.clear()
+
             # Env (already in config) wins; DB is fallback.
             bridge_host_now = config.bridge_host or await db.get_setting("bridge_host")
             app_key_now = config.application_key or await db.get_setting("application_key")
@@ -132,6 +181,7 @@ async def lifespan(app: FastAPI):
             if bridge_host_now != state.bridge_host or app_key_now != state.application_key:
                 state.bridge_host = bridge_host_now
                 state.application_key = app_key_now
+                state.ready_until = 0.0
                 hue.configure(bridge_host=bridge_host_now, application_key=app_key_now)
 
             if not started and bridge_host_now and app_key_now:
@@ -154,102 +204,108 @@ async def lifespan(app: FastAPI):
                     )
                 )
 
-            await asyncio.sleep(2.0)
-
     tasks.append(asyncio.create_task(bootstrap_loop()))
     try:
         yield
     finally:
         for task in tasks:
             task.cancel()
-        for task in tasks:
-            try:
-                await task
-            except BaseException:
-                pass
+        # Let the cancellations unwind concurrently rather than one task at a time.
+        await asyncio.gather(*tasks, return_exceptions=True)
         await hue.close()
         await db.close()
+        loop.set_task_factory(previous_task_factory)
 
 
 app = FastAPI(
     title="Hue Gateway",
     version="2.0.0",
-    description=(
-        "# Hue Gateway API\n\n"
-        "LAN-only Hue Bridge gateway for agentic tool calling.\n\n"
-        "## Auth\n"
-        "All `/v1/*` and `/v2/*` endpoints require **one** of:\n\n"
-        "- `Authorization: Bearer <token>`\n"
-        "- `X-API-Key: <key>`\n\n"
-        "Auth errors:\n"
-        "- v1: **401** `{ \"detail\": {\"error\":\"unauthorized\"} }`\n"
-        "- v2: **401** canonical envelope `{ \"ok\": false, \"error\": {\"code\":\"unauthorized\", ...} }`\n\n"
-        "## Key concepts\n"
-        "- The Hue Bridge is on your LAN and is addressed by `HUE_BRIDGE_HOST` (stored in gateway DB via `bridge.set_host`).\n"
-        "- The Hue application key is created by pressing the physical bridge button and calling `bridge.pair`.\n"
-        "- Most Hue v2 operations are available via `clipv2.request` pass-through.\n"
-        "- For convenience, the gateway also provides high-level actions (`light.set`, `grouped_light.set`, `scene.activate`).\n\n"
-        "## Endpoints\n"
-        "- `GET /healthz` liveness\n"
-        "- `GET /readyz` readiness (bridge host + app key + connectivity)\n"
-        "- `POST /v1/actions` **single action endpoint** (typed request/response via `action` discriminator)\n"
-        "- `GET /v1/events/stream` SSE stream of normalized events\n\n"
-        "- `POST /v2/actions` v2 action endpoint (canonical envelopes, idempotency, verify)\n"
-        "- `GET /v2/events/stream` v2 SSE stream (cursor resume via `Last-Event-ID`)\n\n"
-        "## `/v1/actions` cookbook\n"
-        "All requests use the same envelope:\n\n"
-        "```json\n"
-        "{ \"requestId\": \"optional\", \"action\": \"...\", \"args\": { } }\n"
-        "```\n\n"
-        "### 1) Set the bridge host\n"
-        "```json\n"
-        "{ \"action\": \"bridge.set_host\", \"args\": { \"bridgeHost\": \"192.168.1.29\" } }\n"
-        "```\n\n"
-        "### 2) Pair (press the bridge button first)\n"
-        "```json\n"
-        "{ \"action\": \"bridge.pair\", \"args\": { \"devicetype\": \"hue-gateway#docker\" } }\n"
-        "```\n"
-        "If the button was not pressed recently: **409** with `error.code=link_button_not_pressed`.\n\n"
-        "### 3) List rooms (CLIP v2 pass-through)\n"
-        "```json\n"
-        "{ \"action\": \"clipv2.request\", \"args\": { \"method\": \"GET\", \"path\": \"/clip/v2/resource/room\" } }\n"
-        "```\n\n"
-        "### 4) Turn off a room/zone (grouped light)\n"
-        "Get the grouped light rid from the room resource (`services[].rtype == \"grouped_light\"`).\n"
-        "```json\n"
-        "{ \"action\": \"grouped_light.set\", \"args\": { \"rid\": \"<grouped_light_rid>\", \"on\": false } }\n"
-        "```\n\n"
-        "### 5) Turn on a light by name\n"
-        "```json\n"
-        "{ \"action\": \"light.set\", \"args\": { \"name\": \"Kitchen\", \"on\": true, \"brightness\": 30, \"colorTempK\": 2700 } }\n"
-        "```\n"
-        "If the name is ambiguous: **409** with `error.code=ambiguous_name` and a candidate list.\n\n"
-        "### 6) Activate a scene\n"
-        "```json\n"
-        "{ \"action\": \"scene.activate\", \"args\": { \"name\": \"Relax\" } }\n"
-        "```\n\n"
-        "## Common errors\n"
-        "- **400** invalid JSON / invalid args / unknown action (gateway returns a standard error envelope)\n"
-        "- **409** link button not pressed, or ambiguous name resolution\n"
-        "- **424** bridge unreachable (network/connectivity)\n"
-        "- **429** gateway rate limited: `{ \"error\": \"rate_limited\" }`\n"
-        "- **502** bridge returned a non-2xx error\n\n"
-        "## Events (SSE)\n"
-        "`GET /v1/events/stream` returns `text/event-stream`.\n\n"
-        "Clients should keep the connection open and reconnect on disconnect. The gateway may send keepalive\n"
-        "comment frames (`: keepalive`). Each event is emitted as a single `data: <json>` frame.\n"
-    ),
+    description=APP_DESCRIPTION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 install_custom_openapi(app)
 
 logger = logging.getLogger("hue_gateway")
 
+_SSE_KEEPALIVE = b": keepalive\n\n"
+
 # v2 routes are implemented in a dedicated module to keep /v1 stable.
 from hue_gateway.v2.router import router as v2_router  # noqa: E402
 
 app.include_router(v2_router)
 
+_V2_KNOWN_ACTIONS: frozenset[str] = frozenset(
+    {
+        "bridge.set_host",
+        "bridge.pair",
+        "clipv2.request",
+        "resolve.by_name",
+        "light.set",
+        "grouped_light.set",
+        "scene.activate",
+        "room.set",
+        "zone.set",
+        "inventory.snapshot",
+        "actions.batch",
+    }
+)
+
+
+def _is_json_media_type(content_type: str | None) -> bool:
+    # A missing Content-Type is parsed as JSON (as FastAPI did for a declared body before its
+    # strict_content_type option); otherwise require application/json or application/*+json.
+    if not content_type:
+        return True
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or (
+        media_type.startswith("application/") and media_type.endswith("+json")
+    )
+
+
+async def _read_action_request(request: Request) -> ActionRequest:
+    # Validate the raw bytes directly instead of json.loads + validating the resulting dict.
+    # Failures are re-raised as RequestValidationError so the envelope handler below applies.
+    raw = await request.body()
+    if not raw:
+        raise RequestValidationError(
+            [{"type": "missing", "loc": ("body",), "msg": "Field required", "input": None}]
+        )
+    if not _is_json_media_type(request.headers.get("content-type")):
+        raise RequestValidationError(
+            [
+                {
+                    "type": "model_attributes_type",
+                    "loc": ("body",),
+                    "msg": "Input should be a valid dictionary or object to extract fields from",
+                    "input": raw,
+                }
+            ]
+        )
+    try:
+        return parse_action_request(raw)
+    except ValidationError as exc:
+        errors = [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+        raise RequestValidationError(errors) from None
+
+
+def _json_safe(value):
+    if isinstance(value, (str, int, float, bool)) or value is None:
+        return value
+    if isinstance(value, bytes):
+        try:
+            return value.decode("utf-8", "ignore")
+        except Exception:
+            return repr(value)
+    if isinstance(value, list):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, tuple):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    return str(value)
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     # Normalize validation errors into stable envelopes.
@@ -257,22 +313,6 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     is_v2 = path.startswith("/v2/")
     request_id_header = request.headers.get("x-request-id")
 
-    def _json_safe(value):
-        if isinstance(value, (str, int, float, bool)) or value is None:
-            return value
-        if isinstance(value, bytes):
-            try:
-                return value.decode("utf-8", "ignore")
-            except Exception:
-                return repr(value)
-        if isinstance(value, list):
-            return [_json_safe(v) for v in value]
-        if isinstance(value, tuple):
-            return [_json_safe(v) for v in value]
-        if isinstance(value, dict):
-            return {str(k): _json_safe(v) for k, v in value.items()}
-        return str(value)
-
     details = {"errors": _json_safe(exc.errors())}
     # If the body isn't valid JSON, FastAPI raises a validation error too. We surface it as invalid_json.
     code = "invalid_request"
@@ -290,33 +330,29 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
             details = {"error": str(err.get("msg", "invalid body"))}
             break
 
+    # v2 prefers echoing `action`/`requestId` from the body when parseable; read and parse it once.
+    body_action: str | None = None
+    body_request_id: str | None = None
+    if is_v2 and code != "invalid_json":
+        try:
+            raw = await request.body()
+            parsed = orjson.loads(raw) if raw else None
+        except Exception:
+            parsed = None
+        if isinstance(parsed, dict):
+            if isinstance(parsed.get("action"), str):
+                body_action = parsed["action"]
+            if isinstance(parsed.get("requestId"), str):
+                body_request_id = parsed["requestId"]
+
     if is_v2 and code == "invalid_request":
         # Best-effort specialization into v2's more specific error codes.
         # Prefer unknown_action when the body action is a string we don't recognize.
         # (Pydantic's error type here isn't always a discriminator-specific tag error.)
-        try:
-            raw = await request.body()
-            parsed = json.loads(raw) if raw else None
-            body_action = parsed.get("action") if isinstance(parsed, dict) else None
-            if isinstance(body_action, str):
-                known_actions = {
-                    "bridge.set_host",
-                    "bridge.pair",
-                    "clipv2.request",
-                    "resolve.by_name",
-                    "light.set",
-                    "grouped_light.set",
-                    "scene.activate",
-                    "room.set",
-                    "zone.set",
-                    "inventory.snapshot",
-                    "actions.batch",
-                }
-                if body_action not in known_actions:
-                    code = "unknown_action"
-                    message = "Unknown action"
-        except Exception:
-            pass
+        if isinstance(body_action, str):
+            if body_action not in _V2_KNOWN_ACTIONS:
+                code = "unknown_action"
+                message = "Unknown action"
 
         if code == "invalid_request":
             for err in exc.errors():
@@ -330,22 +366,7 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
                     message = "Field 'args' must match the action schema"
                     break
 
-    # v2 prefers echoing `action`/`requestId` from the body when parseable, but the header wins for correlation.
-    body_action: str | None = None
-    body_request_id: str | None = None
-    if is_v2 and code != "invalid_json":
-        try:
-            raw = await request.body()
-            if raw:
-                parsed = json.loads(raw)
-                if isinstance(parsed, dict):
-                    if isinstance(parsed.get("action"), str):
-                        body_action = parsed["action"]
-                    if isinstance(parsed.get("requestId"), str):
-                        body_request_id = parsed["requestId"]
-        except Exception:
-            pass
-
+    # The header wins over the body requestId for correlation.
     response_request_id = request_id_header if request_id_header else body_request_id
     response_action = body_action if is_v2 else ""
     payload = (
@@ -366,23 +387,22 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
     headers = {}
     if is_v2 and request_id_header:
         headers["X-Request-Id"] = request_id_header
-    return JSONResponse(payload, status_code=status.HTTP_400_BAD_REQUEST, headers=headers)
+    return ORJSONResponse(payload, status_code=status.HTTP_400_BAD_REQUEST, headers=headers)
 
 
 @app.middleware("http")
 async def access_log(request: Request, call_next: Callable[[Request], Response]):
     start = time.perf_counter()
     response = await call_next(request)
-    duration_ms = (time.perf_counter() - start) * 1000
-    request_id = request.headers.get("x-request-id", "")
-    logger.info(
-        "%s %s -> %s (%.1fms) rid=%s",
-        request.method,
-        request.url.path,
-        response.status_code,
-        duration_ms,
-        request_id,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "%s %s -> %s (%.1fms) rid=%s",
+            request.method,
+            request.url.path,
+            response.status_code,
+            (time.perf_counter() - start) * 1000,
+            request.headers.get("x-request-id", ""),
+        )
     return response
 
 
@@ -394,73 +414,55 @@ async def access_log(request: Request, call_next: Callable[[Request], Response])
     tags=["meta"],
 )
 async def healthz() -> HealthResponse:
-    return {"ok": True}
+    return Response(content=_HEALTH_OK_BODY, media_type="application/json")
 
 
 @app.get(
     "/readyz",
     summary="Readiness check",
-    description=(
-        "Returns `ready=true` when the gateway has a bridge host + application key and can reach the Hue Bridge.\n\n"
-        "Common not-ready reasons:\n"
-        "- `missing_bridge_host`\n"
-        "- `missing_application_key`\n"
-        "- `bridge_unreachable`\n"
-        "- `bridge_error`\n"
-    ),
+    description=READYZ_DESCRIPTION,
     response_model=ReadinessResponse,
     tags=["meta"],
 )
 async def readyz() -> ReadinessResponse:
     state: AppState = app.state.state
     if not state.bridge_host:
-        return JSONResponse({"ready": False, "reason": "missing_bridge_host"}, status_code=503)
+        return ORJSONResponse({"ready": False, "reason": "missing_bridge_host"}, status_code=503)
     if not state.application_key:
-        return JSONResponse({"ready": False, "reason": "missing_application_key"}, status_code=503)
+        return ORJSONResponse({"ready": False, "reason": "missing_application_key"}, status_code=503)
+
+    now = time.monotonic()
+    if now < state.ready_until:
+        return _ready_ok_response()
 
     try:
-        await state.dispatcher.hue.get_json("/clip/v2/resource/bridge")
+        await asyncio.wait_for(
+            state.dispatcher.hue.get_json("/clip/v2/resource/bridge"),
+            timeout=_READYZ_TIMEOUT_SECONDS,
+        )
+    except asyncio.TimeoutError:
+        return ORJSONResponse(
+            {"ready": False, "reason": "bridge_unreachable", "details": "timeout"},
+            status_code=503,
+        )
     except HueTransportError as exc:
-        return JSONResponse(
+        return ORJSONResponse(
             {"ready": False, "reason": "bridge_unreachable", "details": str(exc)},
             status_code=503,
         )
     except HueUpstreamError as exc:
-        return JSONResponse(
+        return ORJSONResponse(
             {"ready": False, "reason": "bridge_error", "details": {"status": exc.status_code}},
             status_code=503,
         )
-    return {"ready": True}
+    state.ready_until = time.monotonic() + _READYZ_OK_TTL_SECONDS
+    return _ready_ok_response()
 
 
 @app.post(
     "/v1/actions",
     summary="Single action endpoint",
-    description=(
-        "Execute one action.\n\n"
-        "This endpoint is intentionally *generic* for LLM tool calling. The `action` string selects "
-        "the operation, and `args` carries action-specific parameters.\n\n"
-        "Supported actions (v1):\n\n"
-        "- `bridge.set_host`: persist the Hue Bridge host/IP in the gateway.\n"
-        "  - args: `{ \"bridgeHost\": \"192.168.1.29\" }`\n\n"
-        "- `bridge.pair`: create/store a Hue application key (press the bridge button first).\n"
-        "  - args: `{ \"devicetype\": \"hue-gateway#docker\" }` (optional)\n"
-        "  - on success result: `{ \"applicationKey\": \"...\", \"stored\": true }`\n"
-        "  - if button not pressed: `409` with `error.code=link_button_not_pressed`\n\n"
-        "- `clipv2.request`: CLIP v2 pass-through for advanced use.\n"
-        "  - args: `{ \"method\": \"GET\", \"path\": \"/clip/v2/resource/room\", \"body\": {..} }`\n"
-        "  - safety: `path` must start with `/clip/v2/` and cannot override host.\n\n"
-        "- `resolve.by_name`: fuzzy name → rid resolution using cached/indexed names.\n"
-        "  - args: `{ \"rtype\": \"light\", \"name\": \"Kitchen\" }`\n"
-        "  - may return `409` `ambiguous_name` with candidates.\n\n"
-        "- `light.set`: control a light by `rid` or fuzzy `name`.\n"
-        "  - args include any of: `on`, `brightness` (0-100), `colorTempK`, `xy`.\n\n"
-        "- `grouped_light.set`: control a room/zone grouped light by `rid` or fuzzy `name`.\n\n"
-        "- `scene.activate`: activate a scene by `rid` or fuzzy `name`.\n\n"
-        "Notes:\n"
-        "- Some actions depend on the Hue Bridge inventory and device capabilities.\n"
-        "- Rate limiting: `429` returns `{ \"error\": \"rate_limited\" }`.\n"
-    ),
+    description=ACTIONS_DESCRIPTION,
     response_model=ActionResponse,
     responses={
         200: {
@@ -505,58 +507,39 @@ async def readyz() -> ReadinessResponse:
         502: {"description": "Bad gateway (bridge returned error)."},
         500: {"description": "Internal server error."},
     },
+    # The body is read and validated by hand (see _read_action_request); the request schema
+    # itself is filled in from ACTION_REQUEST_ADAPTER by install_custom_openapi.
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"examples": ACTIONS_EXAMPLES}},
+        }
+    },
     tags=["actions"],
 )
 async def actions(
     request: Request,
-    payload: ActionRequest = Body(
-        ...,
-        openapi_examples={
-            "bridge_set_host": {
-                "summary": "Set bridge host (store in gateway)",
-                "value": {"action": "bridge.set_host", "args": {"bridgeHost": "192.168.1.29"}},
-            },
-            "bridge_pair": {
-                "summary": "Pair after pressing the Hue Bridge button",
-                "value": {"action": "bridge.pair", "args": {"devicetype": "hue-gateway#docker"}},
-            },
-            "list_rooms": {
-                "summary": "List rooms via CLIP v2 pass-through",
-                "value": {
-                    "action": "clipv2.request",
-                    "args": {"method": "GET", "path": "/clip/v2/resource/room"},
-                },
-            },
-            "turn_off_grouped_light": {
-                "summary": "Turn off a room/zone grouped light (by rid)",
-                "value": {"action": "grouped_light.set", "args": {"rid": "<rid>", "on": False}},
-            },
-        },
-    ),
     auth: AuthContext = Depends(require_auth),
 ) -> ActionResponse:
     # `ActionRequest` is a discriminated union; this is one concrete model at runtime.
-    payload_dict = payload.model_dump()
+    payload = await _read_action_request(request)
+    # Only dump fields the client sent: cheaper, and optional args left out stay absent instead of null.
+    payload_dict = payload.model_dump(exclude_unset=True)
 
     state: AppState = app.state.state
     if not state.limiter.allow(auth.credential):
-        return JSONResponse({"error": "rate_limited"}, status_code=status.HTTP_429_TOO_MANY_REQUESTS)
+        return ORJSONResponse({"error": "rate_limited"}, status_code=status.HTTP_429_TOO_MANY_REQUESTS)
     response = await state.dispatcher.dispatch(payload=payload_dict, auth=auth)
+    if response.body_bytes is not None:
+        return Response(content=response.body_bytes, status_code=response.status_code, media_type="application/json")
+    # orjson could not encode the result (see ActionHTTPResponse.success); use the stdlib encoder.
     return JSONResponse(response.body, status_code=response.status_code)
 
 
 @app.get(
     "/v1/events/stream",
     summary="Normalized Hue event stream (SSE)",
-    description=(
-        "Server-Sent Events (SSE) stream of normalized Hue change events.\n\n"
-        "Response is `text/event-stream` where each event is sent as a single `data: <json>` frame.\n"
-        "The gateway may also send `: keepalive` comment frames.\n\n"
-        "Clients should:\n"
-        "- keep the HTTP connection open\n"
-        "- reconnect on disconnect\n"
-        "- treat event `data` as best-effort (shape may evolve)\n"
-    ),
+    description=EVENTS_STREAM_DESCRIPTION,
     tags=["events"],
     responses={
         200: {
@@ -568,16 +551,32 @@ async def actions(
 )
 async def events_stream(_: AuthContext = Depends(require_auth)):
     state: AppState = app.state.state
-    subscription = await state.hub.subscribe()
+    subscription = await state.hub.subscribe(disconnect_when_slow=True)
 
     async def _gen():
+        # Per-frame overflow notices reset subscription.dropped, so the closing notice reports
+        # the stream's running total instead (never 0: the hub only closes after dropping).
+        dropped_total = 0
         try:
             while True:
                 try:
                     event = await asyncio.wait_for(subscription.queue.get(), timeout=15.0)
-                    yield f"data: {json.dumps(event, separators=(',',':'))}\n\n"
+                    if subscription.dropped:
+                        dropped, subscription.dropped = subscription.dropped, 0
+                        dropped_total += dropped
+                        logger.warning("SSE subscriber fell behind; dropped=%d", dropped)
+                        yield sse_data_frame({"type": "overflow", "dropped": dropped})
+                    yield event.frame
+                    if subscription.closed and subscription.queue.empty():
+                        # The hub gave up on this stream; end it so the client reconnects.
+                        dropped_total = max(1, dropped_total + subscription.dropped)
+                        logger.warning(
+                            "SSE subscriber disconnected for falling behind; dropped=%d", dropped_total
+                        )
+                        yield sse_data_frame({"type": "overflow", "dropped": dropped_total})
+                        return
                 except asyncio.TimeoutError:
-                    yield ": keepalive\n\n"
+                    yield _SSE_KEEPALIVE
         finally:
             await subscription.unsubscribe()
 
@@ -1,15 +1,21 @@
 from __future__ import annotations
 
-from collections import defaultdict
+import functools
+import re
 from dataclasses import dataclass
 from typing import Any
 
+# Any whitespace other than a lone space; a single sub() then yields the same
+# result as " ".join(s.split()) without building the intermediate list.
+_WS_RE = re.compile(r"\s{2,}|[^\S ]")
 
+
+@functools.lru_cache(maxsize=4096)
 def normalize_name(value: str) -> str:
-    return " ".join(value.strip().lower().split())
+    return _WS_RE.sub(" ", value.strip().lower())
 
 
-@dataclass
+@dataclass(slots=True)
 class CachedResource:
     rid: str
     rtype: str
@@ -21,26 +27,42 @@ class CachedResource:
 class ResourceCache:
     def __init__(self) -> None:
         self._by_rid: dict[str, CachedResource] = {}
-        self._name_to_rids: dict[str, dict[str, set[str]]] = defaultdict(lambda: defaultdict(set))
-        self._rid_to_name_norm: dict[str, str | None] = {}
+        # Flat (rtype, name_norm) -> rids index; empty buckets are removed.
+        self._name_index: dict[tuple[str, str], set[str]] = {}
 
     def upsert(self, *, rid: str, rtype: str, name: str | None, data: dict[str, Any]) -> None:
+        name_norm = normalize_name(name) if isinstance(name, str) and name.strip() else None
         prev = self._by_rid.get(rid)
+        if prev is not None and prev.rtype == rtype and prev.name_norm == name_norm:
+            # Steady-state resync: name index entries are already correct.
+            prev.name = name
+            prev.data = data
+            return
+
         if prev and prev.name_norm:
-            self._name_to_rids[prev.rtype][prev.name_norm].discard(rid)
+            self._index_discard(prev.rtype, prev.name_norm, rid)
 
-        name_norm = normalize_name(name) if isinstance(name, str) and name.strip() else None
         if name_norm:
-            self._name_to_rids[rtype][name_norm].add(rid)
+            key = (rtype, name_norm)
+            bucket = self._name_index.get(key)
+            if bucket is None:
+                bucket = self._name_index[key] = set()
+            bucket.add(rid)
 
-        self._rid_to_name_norm[rid] = name_norm
         self._by_rid[rid] = CachedResource(rid=rid, rtype=rtype, name=name, name_norm=name_norm, data=data)
 
     def delete(self, *, rid: str) -> None:
         prev = self._by_rid.pop(rid, None)
         if prev and prev.name_norm:
-            self._name_to_rids[prev.rtype][prev.name_norm].discard(rid)
-        self._rid_to_name_norm.pop(rid, None)
+            self._index_discard(prev.rtype, prev.name_norm, rid)
+
+    def _index_discard(self, rtype: str, name_norm: str, rid: str) -> None:
+        key = (rtype, name_norm)
+        bucket = self._name_index.get(key)
+        if bucket is not None:
+            bucket.discard(rid)
+            if not bucket:
+                del self._name_index[key]
 
     def get(self, rid: str) -> CachedResource | None:
         return self._by_rid.get(rid)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import os
@@ -27,21 +28,68 @@ class AppConfig:
     rate_limit_burst: int
     retry_max_attempts: int
     retry_base_delay_ms: int
+    name_cache_ttl_seconds: float = 30.0
+    resolve_cache_ttl_seconds: float = 10.0
+    bridge_max_concurrency: int = 10
+    event_queue_max: int = 256
 
     @staticmethod
     def from_env() -> "AppConfig":
-        return AppConfig(
-            port=int(os.getenv("PORT", "8000")),
-            bridge_host=os.getenv("HUE_BRIDGE_HOST"),
-            application_key=os.getenv("HUE_APPLICATION_KEY"),
-            auth_tokens=_split_csv(os.getenv("GATEWAY_AUTH_TOKENS")),
-            api_keys=_split_csv(os.getenv("GATEWAY_API_KEYS")),
-            cache_resync_seconds=int(os.getenv("CACHE_RESYNC_SECONDS", "300")),
-            fuzzy_match_threshold=float(os.getenv("FUZZY_MATCH_THRESHOLD", "0.90")),
-            fuzzy_match_autopick_threshold=float(os.getenv("FUZZY_MATCH_AUTOPICK_THRESHOLD", "0.95")),
-            fuzzy_match_margin=float(os.getenv("FUZZY_MATCH_MARGIN", "0.05")),
-            rate_limit_rps=float(os.getenv("RATE_LIMIT_RPS", "5")),
-            rate_limit_burst=int(os.getenv("RATE_LIMIT_BURST", "10")),
-            retry_max_attempts=int(os.getenv("RETRY_MAX_ATTEMPTS", "3")),
-            retry_base_delay_ms=int(os.getenv("RETRY_BASE_DELAY_MS", "200")),
-        )
+        # Parsing is memoized on the raw values, so repeated calls only pay for the
+        # env reads; a changed variable still yields a fresh config.
+        return _load_from_env(tuple(os.getenv(name) for name in _ENV_VARS))
+
+    @staticmethod
+    def reload() -> "AppConfig":
+        _load_from_env.cache_clear()
+        return AppConfig.from_env()
+
+
+_ENV_VARS = (
+    "PORT",
+    "HUE_BRIDGE_HOST",
+    "HUE_APPLICATION_KEY",
+    "GATEWAY_AUTH_TOKENS",
+    "GATEWAY_API_KEYS",
+    "CACHE_RESYNC_SECONDS",
+    "FUZZY_MATCH_THRESHOLD",
+    "FUZZY_MATCH_AUTOPICK_THRESHOLD",
+    "FUZZY_MATCH_MARGIN",
+    "RATE_LIMIT_RPS",
+    "RATE_LIMIT_BURST",
+    "RETRY_MAX_ATTEMPTS",
+    "RETRY_BASE_DELAY_MS",
+    "NAME_CACHE_TTL_SECONDS",
+    "RESOLVE_CACHE_TTL_SECONDS",
+    "BRIDGE_MAX_CONCURRENCY",
+    "EVENT_QUEUE_MAX",
+)
+
+
+def _env(env: dict[str, str | None], name: str, default: str) -> str:
+    value = env[name]
+    return default if value is None else value
+
+
+@lru_cache(maxsize=1)
+def _load_from_env(values: tuple[str | None, ...]) -> AppConfig:
+    env = dict(zip(_ENV_VARS, values))
+    return AppConfig(
+        port=int(_env(env, "PORT", "8000")),
+        bridge_host=env["HUE_BRIDGE_HOST"],
+        application_key=env["HUE_APPLICATION_KEY"],
+        auth_tokens=_split_csv(env["GATEWAY_AUTH_TOKENS"]),
+        api_keys=_split_csv(env["GATEWAY_API_KEYS"]),
+        cache_resync_seconds=int(_env(env, "CACHE_RESYNC_SECONDS", "300")),
+        fuzzy_match_threshold=float(_env(env, "FUZZY_MATCH_THRESHOLD", "0.90")),
+        fuzzy_match_autopick_threshold=float(_env(env, "FUZZY_MATCH_AUTOPICK_THRESHOLD", "0.95")),
+        fuzzy_match_margin=float(_env(env, "FUZZY_MATCH_MARGIN", "0.05")),
+        rate_limit_rps=float(_env(env, "RATE_LIMIT_RPS", "5")),
+        rate_limit_burst=int(_env(env, "RATE_LIMIT_BURST", "10")),
+        retry_max_attempts=int(_env(env, "RETRY_MAX_ATTEMPTS", "3")),
+        retry_base_delay_ms=int(_env(env, "RETRY_BASE_DELAY_MS", "200")),
+        name_cache_ttl_seconds=float(_env(env, "NAME_CACHE_TTL_SECONDS", "30")),
+        resolve_cache_ttl_seconds=float(_env(env, "RESOLVE_CACHE_TTL_SECONDS", "10")),
+        bridge_max_concurrency=int(_env(env, "BRIDGE_MAX_CONCURRENCY", "10")),
+        event_queue_max=int(_env(env, "EVENT_QUEUE_MAX", "256")),
+    )
@@ -1,26 +1,124 @@
 from __future__ import annotations
 
+import asyncio
+import json
 import os
+import sqlite3
 import time
-from typing import Any
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator, Iterable
 
 import aiosqlite
 
+from hue_gateway.cache import normalize_name
+
+# SQLite >= 3.45 can keep resource documents in its binary JSONB form, which json_extract reads
+# without re-parsing. Older libraries keep plain JSON text; both forms can share the column.
+_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+# Malformed input is stored as given (as before) rather than failing the upsert.
+_JSON_VALUE = "CASE WHEN json_valid(:json) THEN jsonb(:json) ELSE :json END" if _JSONB else ":json"
+# json_valid flag 5 = RFC 8259 text or JSONB, so rows written before the switch stay readable.
+_JSON_VALID = "json_valid(json, 5)" if _JSONB else "json_valid(json)"
+_JSON_TEXT = f"CASE WHEN {_JSON_VALID} THEN json(json) END" if _JSONB else "json"
+
+# Statement text is built once here: sqlite3's per-connection statement cache is keyed on the SQL
+# string, so hot queries skip sqlite3_prepare after first use (and f-strings are not rebuilt per call).
+_SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+_SQL_SET_SETTING = """
+INSERT INTO settings (key, value, updated_at)
+VALUES (?, ?, ?)
+ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at
+"""
+# RETURNING (SQLite >= 3.35) hands back the new value; no follow-up SELECT.
+_SQL_INCREMENT_SETTING = """
+INSERT INTO settings (key, value, updated_at)
+VALUES (?, '1', ?)
+ON CONFLICT(key) DO UPDATE SET value=CAST(settings.value AS INTEGER) + 1, updated_at=excluded.updated_at
+RETURNING CAST(value AS INTEGER)
+"""
+_SQL_UPSERT_RESOURCE = f"""
+INSERT INTO resources (rid, rtype, name, name_norm, json, updated_at)
+VALUES (:rid, :rtype, :name, :name_norm, {_JSON_VALUE}, :updated_at)
+ON CONFLICT(rid) DO UPDATE SET
+  rtype=excluded.rtype,
+  name=excluded.name,
+  name_norm=excluded.name_norm,
+  json=excluded.json,
+  updated_at=excluded.updated_at
+"""
+_SQL_DELETE_RESOURCE = "DELETE FROM resources WHERE rid = ?"
+_SQL_GET_RESOURCE = f"SELECT {_JSON_TEXT} FROM resources WHERE rid = ?"
+_SQL_LIST_NAME_CANDIDATES = "SELECT name_norm, rid, name FROM resources WHERE rtype = ? AND name_norm IS NOT NULL"
+_SQL_LIST_RESOURCES = f"SELECT {_JSON_TEXT} FROM resources WHERE rtype = ?"
+_SQL_SELECT_NAMED_RESOURCES = "SELECT rid, name FROM resources WHERE name IS NOT NULL"
+_SQL_SET_NAME_NORM = "UPDATE resources SET name_norm = ? WHERE rid = ?"
+_SQL_FIELD_COLUMN = "CASE WHEN json_type(json, ?) IN ('object', 'array') THEN NULL ELSE json_extract(json, ?) END"
+
+
+@lru_cache(maxsize=16)
+def _sql_list_resource_fields(n_paths: int) -> str:
+    columns = ", ".join([_SQL_FIELD_COLUMN] * n_paths)
+    return f"""
+SELECT {columns}
+FROM resources
+WHERE rtype = ? AND {_JSON_VALID} AND json_type(json) = 'object'
+"""
+
 
 class Database:
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        cache_size_kib: int = 64_000,
+        mmap_size_bytes: int = 256 * 1024 * 1024,
+        busy_timeout_ms: int = 5000,
+        readers: int = 2,
+    ):
         self._db_path = db_path
         self._conn: aiosqlite.Connection | None = None
+        # Extra query_only connections so reads run alongside the writer under WAL. An in-memory
+        # database is private to its connection, so it always uses the writer for reads.
+        self._reader_count = 0 if _is_memory_path(db_path) else max(0, int(readers))
+        self._readers: list[aiosqlite.Connection] = []
+        self._next_reader = 0
+        self._cache_size_kib = int(cache_size_kib)
+        self._mmap_size_bytes = int(mmap_size_bytes)
+        self._busy_timeout_ms = int(busy_timeout_ms)
+        # All tasks share the one writer connection, so only one of them may have a transaction
+        # open on it at a time; the owning task is tracked so nested blocks become savepoints.
+        self._write_lock = asyncio.Lock()
+        self._write_owner: asyncio.Task[Any] | None = None
+        self._savepoint_depth = 0
 
     async def connect(self) -> None:
         dir_name = os.path.dirname(self._db_path)
         if dir_name:
             os.makedirs(dir_name, exist_ok=True)
-        self._conn = await aiosqlite.connect(self._db_path)
-        await self._conn.execute("PRAGMA journal_mode=WAL;")
-        await self._conn.execute("PRAGMA synchronous=NORMAL;")
+        self._conn = await self._open_connection()
         await self._init_schema()
         await self._conn.commit()
+        if await self._migrate_name_norm():
+            await self.rebuild_name_index()
+        for _ in range(self._reader_count):
+            self._readers.append(await self._open_connection(query_only=True))
+
+    async def _open_connection(self, *, query_only: bool = False) -> aiosqlite.Connection:
+        conn = await aiosqlite.connect(self._db_path)
+        # One script, one round-trip to the aiosqlite worker thread.
+        await conn.executescript(
+            f"""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-{self._cache_size_kib};
+            PRAGMA mmap_size={self._mmap_size_bytes};
+            PRAGMA busy_timeout={self._busy_timeout_ms};
+            PRAGMA query_only={"ON" if query_only else "OFF"};
+            """
+        )
+        return conn
 
     @property
     def conn(self) -> aiosqlite.Connection:
@@ -28,6 +126,18 @@ class Database:
             raise RuntimeError("Database not connected")
         return self._conn
 
+    @property
+    def reader(self) -> aiosqlite.Connection:
+        """
+        Connection for standalone reads (round-robin over the readers). Readers only see committed
+        data, so read-modify-write sequences should stay on `conn`.
+        """
+        if not self._readers:
+            return self.conn
+        idx = self._next_reader
+        self._next_reader = (idx + 1) % len(self._readers)
+        return self._readers[idx]
+
     async def _init_schema(self) -> None:
         await self.conn.execute(
             """
@@ -67,37 +177,41 @@ class Database:
               rid TEXT PRIMARY KEY,
               rtype TEXT NOT NULL,
               name TEXT,
-              json TEXT NOT NULL,
+              name_norm TEXT,
+              json BLOB NOT NULL,
               updated_at INTEGER NOT NULL
             );
             """
         )
-        await self.conn.execute(
-            """
-            CREATE TABLE IF NOT EXISTS name_index (
-              rtype TEXT NOT NULL,
-              name_norm TEXT NOT NULL,
-              rid TEXT NOT NULL,
-              PRIMARY KEY (rtype, name_norm, rid)
-            );
-            """
-        )
         await self.conn.execute(
             """
             CREATE INDEX IF NOT EXISTS idx_resources_rtype ON resources (rtype);
             """
         )
+        # Superseded by resources.name_norm.
+        await self.conn.execute("DROP TABLE IF EXISTS name_index;")
+
+    async def _migrate_name_norm(self) -> bool:
+        """
+        Add resources.name_norm to databases created before it existed. Returns True when the column
+        was added (its values still need a backfill).
+        """
+        added = False
+        async with self.conn.execute("PRAGMA table_info(resources)") as cursor:
+            columns = {row[1] async for row in cursor}
+        if "name_norm" not in columns:
+            await self.conn.execute("ALTER TABLE resources ADD COLUMN name_norm TEXT")
+            added = True
         await self.conn.execute(
             """
-            CREATE INDEX IF NOT EXISTS idx_name_index_rtype_name ON name_index (rtype, name_norm);
+            CREATE INDEX IF NOT EXISTS idx_resources_rtype_name_norm ON resources (rtype, name_norm);
             """
         )
+        await self.conn.commit()
+        return added
 
     async def get_setting(self, key: str) -> str | None:
-        async with self.conn.execute(
-            "SELECT value FROM settings WHERE key = ?",
-            (key,),
-        ) as cursor:
+        async with self.reader.execute(_SQL_GET_SETTING, (key,)) as cursor:
             row = await cursor.fetchone()
         if not row:
             return None
@@ -114,32 +228,61 @@ class Database:
 
     async def set_setting(self, key: str, value: str) -> None:
         now = int(time.time())
-        await self.conn.execute(
-            """
-            INSERT INTO settings (key, value, updated_at)
-            VALUES (?, ?, ?)
-            ON CONFLICT(key) DO UPDATE SET value=excluded.value, updated_at=excluded.updated_at
-            """,
-            (key, value, now),
-        )
-        await self.conn.commit()
+        async with self.transaction():
+            await self.conn.execute(_SQL_SET_SETTING, (key, value, now))
 
     async def increment_setting_int(self, key: str) -> int:
         now = int(time.time())
-        await self.conn.execute(
-            """
-            INSERT INTO settings (key, value, updated_at)
-            VALUES (?, '1', ?)
-            ON CONFLICT(key) DO UPDATE SET value=CAST(settings.value AS INTEGER) + 1, updated_at=excluded.updated_at
-            """,
-            (key, now),
-        )
-        await self.conn.commit()
-        return await self.get_setting_int(key, default=0)
+        async with self.transaction():
+            async with self.conn.execute(_SQL_INCREMENT_SETTING, (key, now)) as cursor:
+                row = await cursor.fetchone()
+        return int(row[0]) if row else 0
 
     async def commit(self) -> None:
         await self.conn.commit()
 
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        """
+        Run writer mutations as one transaction (one commit, one WAL sync). Other tasks' writes wait
+        for the block to finish; a block nested in the same task runs as a savepoint, so only the
+        outermost block commits or rolls back.
+        """
+        task = asyncio.current_task()
+        if task is not None and self._write_owner is task:
+            async with self._savepoint():
+                yield
+            return
+
+        async with self._write_lock:
+            self._write_owner = task
+            try:
+                await self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield
+                except BaseException:
+                    await self.conn.rollback()
+                    raise
+                await self.conn.commit()
+            finally:
+                self._write_owner = None
+
+    @asynccontextmanager
+    async def _savepoint(self) -> AsyncIterator[None]:
+        self._savepoint_depth += 1
+        name = f"sp_{self._savepoint_depth}"
+        try:
+            await self.conn.execute(f"SAVEPOINT {name}")
+            try:
+                yield
+            except BaseException:
+                await self.conn.execute(f"ROLLBACK TO {name}")
+                await self.conn.execute(f"RELEASE {name}")
+                raise
+            await self.conn.execute(f"RELEASE {name}")
+        finally:
+            self._savepoint_depth -= 1
+
     async def upsert_resource(
         self,
         *,
@@ -150,98 +293,126 @@ class Database:
         updated_at: int | None = None,
     ) -> None:
         now = int(time.time()) if updated_at is None else updated_at
+        # The normalized name is stored on the row itself, so an upsert keeps name lookups current
+        # without a separate index table to rewrite.
+        name_norm = normalize_name(name) if name else ""
         await self.conn.execute(
-            """
-            INSERT INTO resources (rid, rtype, name, json, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(rid) DO UPDATE SET
-              rtype=excluded.rtype,
-              name=excluded.name,
-              json=excluded.json,
-              updated_at=excluded.updated_at
-            """,
-            (rid, rtype, name, json_text, now),
+            _SQL_UPSERT_RESOURCE,
+            {
+                "rid": rid,
+                "rtype": rtype,
+                "name": name,
+                "name_norm": name_norm or None,
+                "json": json_text,
+                "updated_at": now,
+            },
         )
 
-    async def delete_name_index_for_rid(self, rid: str) -> None:
-        await self.conn.execute("DELETE FROM name_index WHERE rid = ?", (rid,))
-
-    async def insert_name_index(self, *, rtype: str, name_norm: str, rid: str) -> None:
-        await self.conn.execute(
-            """
-            INSERT OR IGNORE INTO name_index (rtype, name_norm, rid)
-            VALUES (?, ?, ?)
-            """,
-            (rtype, name_norm, rid),
-        )
+    async def upsert_resources(
+        self,
+        rows: Iterable[tuple[str, str, str | None, str]],
+        *,
+        updated_at: int | None = None,
+    ) -> None:
+        """
+        Upsert many (rid, rtype, name, json_text) rows with one executemany, committed together.
+        """
+        now = int(time.time()) if updated_at is None else updated_at
+        params = []
+        for rid, rtype, name, json_text in rows:
+            name_norm = normalize_name(name) if name else ""
+            params.append(
+                {
+                    "rid": rid,
+                    "rtype": rtype,
+                    "name": name,
+                    "name_norm": name_norm or None,
+                    "json": json_text,
+                    "updated_at": now,
+                }
+            )
+        async with self.transaction():
+            await self.conn.executemany(_SQL_UPSERT_RESOURCE, params)
 
     async def delete_resource(self, rid: str) -> None:
-        await self.delete_name_index_for_rid(rid)
-        await self.conn.execute("DELETE FROM resources WHERE rid = ?", (rid,))
+        await self.conn.execute(_SQL_DELETE_RESOURCE, (rid,))
 
     async def get_resource(self, rid: str) -> dict[str, Any] | None:
-        async with self.conn.execute(
-            "SELECT json FROM resources WHERE rid = ?",
-            (rid,),
-        ) as cursor:
+        async with self.reader.execute(_SQL_GET_RESOURCE, (rid,)) as cursor:
             row = await cursor.fetchone()
         if not row:
             return None
-        import json
-
         try:
             return json.loads(row[0])
         except Exception:
             return None
 
+    async def iter_name_candidates(self, *, rtype: str) -> AsyncIterator[tuple[str, str, str | None]]:
+        """
+        Yields: (name_norm, rid, name_display). Rows arrive in cursor chunks, not one fetchall().
+        """
+        async with self.reader.execute(_SQL_LIST_NAME_CANDIDATES, (rtype,)) as cursor:
+            async for name_norm, rid, name in cursor:
+                yield (str(name_norm), str(rid), str(name) if name is not None else None)
+
     async def list_name_candidates(self, *, rtype: str) -> list[tuple[str, str, str | None]]:
         """
         Returns: [(name_norm, rid, name_display), ...]
         """
-        async with self.conn.execute(
-            """
-            SELECT ni.name_norm, ni.rid, r.name
-            FROM name_index ni
-            LEFT JOIN resources r ON r.rid = ni.rid
-            WHERE ni.rtype = ?
-            """,
-            (rtype,),
-        ) as cursor:
+        return [cand async for cand in self.iter_name_candidates(rtype=rtype)]
+
+    async def list_resource_fields(self, *, rtype: str, paths: list[str]) -> list[tuple[Any, ...]]:
+        """
+        Project scalar fields (JSON paths such as `$.id`) out of each stored resource inside SQLite,
+        so callers that need a few fields skip decoding whole documents in Python. Object/array
+        values come back as None; rows that are not JSON objects are skipped, as in list_resources.
+        """
+        params: list[Any] = []
+        for path in paths:
+            params.extend((path, path))
+        params.append(rtype)
+        async with self.reader.execute(_sql_list_resource_fields(len(paths)), params) as cursor:
             rows = await cursor.fetchall()
-        return [(str(name_norm), str(rid), str(name) if name is not None else None) for name_norm, rid, name in rows]
+        return [tuple(row) for row in rows]
 
-    async def list_resources(self, *, rtype: str) -> list[dict[str, Any]]:
-        import json
+    async def iter_resources(self, *, rtype: str) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yields decoded resource objects as cursor chunks arrive, so only one chunk of raw rows is
+        held at a time. Rows that do not decode to a JSON object are skipped.
+        """
+        loads = json.loads
+        async with self.reader.execute(_SQL_LIST_RESOURCES, (rtype,)) as cursor:
+            async for (json_text,) in cursor:
+                try:
+                    obj = loads(json_text)
+                except Exception:
+                    continue
+                if isinstance(obj, dict):
+                    yield obj
 
-        async with self.conn.execute(
-            "SELECT json FROM resources WHERE rtype = ?",
-            (rtype,),
-        ) as cursor:
-            rows = await cursor.fetchall()
-        out: list[dict[str, Any]] = []
-        for (json_text,) in rows:
-            try:
-                obj = json.loads(json_text)
-            except Exception:
-                continue
-            if isinstance(obj, dict):
-                out.append(obj)
-        return out
+    async def list_resources(self, *, rtype: str) -> list[dict[str, Any]]:
+        return [obj async for obj in self.iter_resources(rtype=rtype)]
 
     async def rebuild_name_index(self) -> None:
-        await self.conn.execute("DELETE FROM name_index")
-        async with self.conn.execute(
-            "SELECT rid, rtype, name FROM resources WHERE name IS NOT NULL"
-        ) as cursor:
+        """
+        Recompute name_norm for every named resource. Upserts keep it current, so this is only
+        needed for rows written before the column existed or after normalize_name changes.
+        """
+        async with self.conn.execute(_SQL_SELECT_NAMED_RESOURCES) as cursor:
             rows = await cursor.fetchall()
-        for rid, rtype, name in rows:
-            name_norm = " ".join(str(name).strip().lower().split())
-            if not name_norm:
-                continue
-            await self.insert_name_index(rtype=str(rtype), name_norm=name_norm, rid=str(rid))
-        await self.conn.commit()
+        params = [(normalize_name(str(name)) or None, str(rid)) for rid, name in rows]
+        # One executemany is one hop to the aiosqlite worker thread instead of one per row.
+        async with self.transaction():
+            await self.conn.executemany(_SQL_SET_NAME_NORM, params)
 
     async def close(self) -> None:
+        readers, self._readers = self._readers, []
+        for reader in readers:
+            await reader.close()
         if self._conn:
             await self._conn.close()
             self._conn = None
+
+
+def _is_memory_path(db_path: str) -> bool:
+    return db_path in ("", ":memory:") or "mode=memory" in db_path or db_path.startswith("file::memory:")
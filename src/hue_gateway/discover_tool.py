@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import html
 import ipaddress
+import json
 import os
+import re
 import socket
 import sys
 import time
 import urllib.parse
-import xml.etree.ElementTree as ET
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -28,14 +32,16 @@ class DiscoveredBridge:
     raw: dict[str, Any] | None = None
 
 
-def _parse_httpish_headers(packet: str) -> dict[str, str]:
-    headers: dict[str, str] = {}
-    for line in packet.splitlines():
-        if ":" not in line:
-            continue
-        k, v = line.split(":", 1)
-        headers[k.strip().lower()] = v.strip()
-    return headers
+# Header lines in an SSDP datagram: a token name, a colon, then the value up to end of line.
+_HDR_RE = re.compile(rb"^[ \t]*([!-9;-~]+)[ \t]*:[ \t]*([^\r\n]*)", re.M)
+
+
+def _parse_httpish_headers(packet: str | bytes) -> dict[str, str]:
+    # One regex pass over the raw datagram; only header names/values are decoded, not the packet.
+    data = packet.encode("utf-8") if isinstance(packet, str) else packet
+    return {
+        k.lower().decode("ascii"): v.strip().decode("utf-8", "ignore") for k, v in _HDR_RE.findall(data)
+    }
 
 
 def _ip_from_location(location: str) -> str | None:
@@ -48,70 +54,76 @@ def _ip_from_location(location: str) -> str | None:
     return None
 
 
-def _looks_like_hue_description(xml_text: str) -> bool:
-    # Heuristic per common Hue UPnP description.xml patterns: Basic:1 + friendly name contains hue.
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return False
+# description.xml is tiny and flat; one regex pass over the first <device> element replaces two
+# ElementTree parses per host. Namespace prefixes are optional, first occurrence wins (the root
+# device's own fields precede any embedded deviceList).
+_UPNP_DEVICE_RE = re.compile(r"<(?:[\w.-]+:)?device[\s>]")
+_UPNP_FIELD_RE = re.compile(r"<(?:[\w.-]+:)?(deviceType|friendlyName|manufacturer|modelName|UDN)(?:\s[^>]*)?>([^<]*)</")
+
+
+_UPNP_FIELD_COUNT = 5
+# Case-insensitive matches replace lower() copies of each field.
+_UPNP_BASIC1_RE = re.compile(re.escape("urn:schemas-upnp-org:device:basic:1"), re.IGNORECASE)
+_HUE_VENDOR_RE = re.compile("hue|philips|signify", re.IGNORECASE)
 
-    ns = {"upnp": "urn:schemas-upnp-org:device-1-0"}
-    device = root.find(".//upnp:device", ns)
+
+def _scan_upnp(xml_text: str) -> dict[str, str]:
+    device = _UPNP_DEVICE_RE.search(xml_text)
     if device is None:
-        device = root.find(".//device")
-
-    def _find_text(path: str) -> str | None:
-        el = device.find(path, ns) if device is not None else None
-        if el is None and device is not None:
-            el = device.find(path.replace("upnp:", ""))
-        if el is not None and el.text:
-            return el.text.strip()
-        return None
+        return {}
+    out: dict[str, str] = {}
+    for match in _UPNP_FIELD_RE.finditer(xml_text, device.end()):
+        tag, value = match.groups()
+        value = value.strip()
+        if value and tag not in out:
+            out[tag] = html.unescape(value)
+            if len(out) == _UPNP_FIELD_COUNT:
+                # Icon lists and service tables follow the device fields; no need to scan them.
+                break
+    return out
 
-    device_type = _find_text("upnp:deviceType") or _find_text("deviceType")
-    friendly = _find_text("upnp:friendlyName") or _find_text("friendlyName")
-    manufacturer = _find_text("upnp:manufacturer") or _find_text("manufacturer")
-    model_name = _find_text("upnp:modelName") or _find_text("modelName")
 
-    if device_type and "urn:schemas-upnp-org:device:basic:1" in device_type.lower():
+def _is_hue_upnp(fields: dict[str, str]) -> bool:
+    # Heuristic per common Hue UPnP description.xml patterns: Basic:1 + friendly name contains hue.
+    device_type = fields.get("deviceType")
+    if device_type and _UPNP_BASIC1_RE.search(device_type):
         # Accept Philips/Signify strings or a friendlyName/modelName containing hue.
-        hay = " ".join([friendly or "", manufacturer or "", model_name or ""]).lower()
-        return "hue" in hay or "philips" in hay or "signify" in hay
+        search = _HUE_VENDOR_RE.search
+        return any(search(fields.get(tag, "")) for tag in ("friendlyName", "manufacturer", "modelName"))
 
     return False
 
 
+def _hue_upnp_fields(xml_text: str) -> dict[str, str | None] | None:
+    """
+    Scan description.xml once: the extracted bridge fields if it looks like a Hue bridge, else None.
+    """
+    fields = _scan_upnp(xml_text)
+    if not _is_hue_upnp(fields):
+        return None
+    return _bridge_fields(fields)
+
+
+def _looks_like_hue_description(xml_text: str) -> bool:
+    return _is_hue_upnp(_scan_upnp(xml_text))
+
+
 def _extract_upnp_fields(xml_text: str) -> dict[str, str | None]:
-    out: dict[str, str | None] = {"udn": None, "model": None, "friendly_name": None}
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return out
+    return _bridge_fields(_scan_upnp(xml_text))
 
-    ns = {"upnp": "urn:schemas-upnp-org:device-1-0"}
-    device = root.find(".//upnp:device", ns)
-    if device is None:
-        device = root.find(".//device")
-    if device is None:
-        return out
-
-    def _text(tag: str) -> str | None:
-        el = device.find(tag, ns)
-        if el is None:
-            el = device.find(tag.replace("upnp:", ""))
-        if el is not None and el.text:
-            return el.text.strip()
-        return None
 
-    out["udn"] = _text("upnp:UDN") or _text("UDN")
-    out["model"] = _text("upnp:modelName") or _text("modelName")
-    out["friendly_name"] = _text("upnp:friendlyName") or _text("friendlyName")
-    return out
+def _bridge_fields(fields: dict[str, str]) -> dict[str, str | None]:
+    return {
+        "udn": fields.get("UDN"),
+        "model": fields.get("modelName"),
+        "friendly_name": fields.get("friendlyName"),
+    }
 
 
-def ssdp_discover(*, timeout_seconds: float = 3.0, st: str = "ssdp:all") -> list[DiscoveredBridge]:
+@lru_cache(maxsize=8)
+def _ssdp_msearch(st: str) -> bytes:
     # Best practice: simple M-SEARCH; avoid quoting MAN value (some bridges are picky).
-    msg = "\r\n".join(
+    return "\r\n".join(
         [
             "M-SEARCH * HTTP/1.1",
             f"HOST: {SSDP_ADDR[0]}:{SSDP_ADDR[1]}",
@@ -123,46 +135,64 @@ def ssdp_discover(*, timeout_seconds: float = 3.0, st: str = "ssdp:all") -> list
         ]
     ).encode("utf-8")
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
-    try:
-        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        sock.settimeout(0.2)
-        sock.sendto(msg, SSDP_ADDR)
 
-        deadline = time.time() + timeout_seconds
-        found: dict[str, DiscoveredBridge] = {}
+def _bridge_from_ssdp_packet(data: bytes, addr: tuple[str, int]) -> DiscoveredBridge | None:
+    headers = _parse_httpish_headers(data)
 
-        while time.time() < deadline:
-            try:
-                data, addr = sock.recvfrom(65535)
-            except socket.timeout:
-                continue
-            packet = data.decode("utf-8", "ignore")
-            headers = _parse_httpish_headers(packet)
-
-            location = headers.get("location")
-            ip = _ip_from_location(location) if location else None
-            if not ip:
-                ip = addr[0]
-
-            server = headers.get("server", "")
-            st_hdr = headers.get("st", "")
-            looks = ("ipbridge" in server.lower()) or ("ipbridge" in packet.lower()) or (
-                "urn:schemas-upnp-org:device:basic:1" in st_hdr.lower()
-            )
-            if not looks:
-                continue
-
-            found[ip] = DiscoveredBridge(
-                ip=ip,
-                source="ssdp",
-                location=location,
-                raw={"headers": headers, "from": addr[0]},
-            )
+    location = headers.get("location")
+    ip = _ip_from_location(location) if location else None
+    if not ip:
+        ip = addr[0]
+
+    server = headers.get("server", "")
+    st_hdr = headers.get("st", "")
+    looks = ("ipbridge" in server.lower()) or (b"ipbridge" in data.lower()) or (
+        "urn:schemas-upnp-org:device:basic:1" in st_hdr.lower()
+    )
+    if not looks:
+        return None
+
+    return DiscoveredBridge(
+        ip=ip,
+        source="ssdp",
+        location=location,
+        raw={"headers": headers, "from": addr[0]},
+    )
+
+
+class _SSDPProtocol(asyncio.DatagramProtocol):
+    """Collects M-SEARCH responses as the event loop delivers them (no polling recv loop)."""
+
+    def __init__(self) -> None:
+        self.found: dict[str, DiscoveredBridge] = {}
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        bridge = _bridge_from_ssdp_packet(data, addr)
+        if bridge is not None:
+            self.found[bridge.ip] = bridge
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP errors for individual responders are not fatal to discovery.
+        pass
 
-        return list(found.values())
+
+async def ssdp_discover_async(*, timeout_seconds: float = 3.0, st: str = "ssdp:all") -> list[DiscoveredBridge]:
+    loop = asyncio.get_running_loop()
+    transport, protocol = await loop.create_datagram_endpoint(
+        _SSDPProtocol,
+        local_addr=("0.0.0.0", 0),
+        family=socket.AF_INET,
+    )
+    try:
+        transport.sendto(_ssdp_msearch(st), SSDP_ADDR)
+        await asyncio.sleep(timeout_seconds)
+        return list(protocol.found.values())
     finally:
-        sock.close()
+        transport.close()
+
+
+def ssdp_discover(*, timeout_seconds: float = 3.0, st: str = "ssdp:all") -> list[DiscoveredBridge]:
+    return asyncio.run(ssdp_discover_async(timeout_seconds=timeout_seconds, st=st))
 
 
 def _fetch_description(location: str, *, timeout: float = 2.0) -> str | None:
@@ -180,9 +210,9 @@ def enrich_with_description(bridge: DiscoveredBridge) -> DiscoveredBridge:
     if not bridge.location:
         return bridge
     xml_text = _fetch_description(bridge.location)
-    if not xml_text or not _looks_like_hue_description(xml_text):
+    fields = _hue_upnp_fields(xml_text) if xml_text else None
+    if fields is None:
         return bridge
-    fields = _extract_upnp_fields(xml_text)
     return DiscoveredBridge(
         ip=bridge.ip,
         source=bridge.source,
@@ -227,54 +257,53 @@ def mdns_discover(*, timeout_seconds: float = 3.0) -> list[DiscoveredBridge]:
     return list(found.values())
 
 
-def ip_scan_description_xml(*, cidr: str, timeout: float = 0.4, concurrency: int = 64) -> list[DiscoveredBridge]:
+async def _probe_description(client: httpx.AsyncClient, ip: str) -> DiscoveredBridge | None:
+    url = f"http://{ip}/description.xml"
+    try:
+        resp = await client.get(url)
+    except Exception:
+        return None
+    fields = _hue_upnp_fields(resp.text) if resp.status_code == 200 else None
+    if fields is None:
+        return None
+    return DiscoveredBridge(
+        ip=ip,
+        source="scan",
+        location=url,
+        udn=fields.get("udn"),
+        model=fields.get("model"),
+        friendly_name=fields.get("friendly_name"),
+    )
+
+
+async def ip_scan_async(*, cidr: str, timeout: float = 0.4, concurrency: int = 64) -> list[DiscoveredBridge]:
     # Fallback (slow): scan for http://<ip>/description.xml
     net = ipaddress.ip_network(cidr, strict=False)
-    hosts = [str(ip) for ip in net.hosts()]
-    found: list[DiscoveredBridge] = []
-    import threading
-
-    lock = threading.Lock()
-
-    def worker(ip: str) -> None:
-        url = f"http://{ip}/description.xml"
-        try:
-            with httpx.Client(timeout=timeout) as client:
-                resp = client.get(url)
-                if resp.status_code != 200:
-                    return
-                if not _looks_like_hue_description(resp.text):
-                    return
-                fields = _extract_upnp_fields(resp.text)
-                with lock:
-                    found.append(
-                        DiscoveredBridge(
-                            ip=ip,
-                            source="scan",
-                            location=url,
-                            udn=fields.get("udn"),
-                            model=fields.get("model"),
-                            friendly_name=fields.get("friendly_name"),
-                        )
-                    )
-        except Exception:
-            return
+    hosts = (str(ip) for ip in net.hosts())
+    concurrency = max(1, int(concurrency))
+    found: dict[str, DiscoveredBridge] = {}
+
+    # A fixed set of workers pulls hosts from one iterator: bounded concurrency on a single thread,
+    # and no per-host task objects even for large CIDRs.
+    async def worker(client: httpx.AsyncClient) -> None:
+        for ip in hosts:
+            bridge = await _probe_description(client, ip)
+            if bridge is not None:
+                found[bridge.ip] = bridge
 
-    # Simple bounded concurrency using threads (portable, avoids asyncio complexity for operators).
-    import concurrent.futures
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(timeout=timeout, limits=limits) as client:
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as ex:
-        list(ex.map(worker, hosts))
+    return list(found.values())
 
-    # de-dupe by ip
-    uniq: dict[str, DiscoveredBridge] = {b.ip: b for b in found}
-    return list(uniq.values())
+
+def ip_scan_description_xml(*, cidr: str, timeout: float = 0.4, concurrency: int = 64) -> list[DiscoveredBridge]:
+    return asyncio.run(ip_scan_async(cidr=cidr, timeout=timeout, concurrency=concurrency))
 
 
 def _print_bridges(bridges: list[DiscoveredBridge], *, json_out: bool) -> None:
     if json_out:
-        import json
-
         print(
             json.dumps(
                 [
@@ -358,6 +387,41 @@ def _maybe_set_gateway_host(
             print(f"Failed to set gateway bridge host: HTTP {resp.status_code} {resp.text}", file=sys.stderr)
 
 
+async def _discover_all(args: argparse.Namespace) -> list[DiscoveredBridge]:
+    # SSDP and the CIDR scan run on the event loop; blocking mDNS runs in a worker thread, so all
+    # discovery windows overlap.
+    jobs = []
+    if not args.no_ssdp:
+        jobs.append(ssdp_discover_async(timeout_seconds=args.timeout_seconds))
+    if not args.no_mdns:
+        jobs.append(asyncio.to_thread(mdns_discover, timeout_seconds=args.timeout_seconds))
+    if args.scan_cidr:
+        jobs.append(
+            ip_scan_async(
+                cidr=args.scan_cidr,
+                timeout=args.scan_timeout,
+                concurrency=args.scan_concurrency,
+            )
+        )
+
+    bridges: list[DiscoveredBridge] = []
+    for result in await asyncio.gather(*jobs, return_exceptions=True):
+        if isinstance(result, BaseException):
+            continue
+        bridges.extend(result)
+    return bridges
+
+
+def _run(coro: Any) -> Any:
+    # The server already runs on uvloop (see __main__); the CLI uses it too for the scan fan-out.
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(prog="hue-gateway-discover")
     parser.add_argument("--timeout-seconds", type=float, default=3.0)
@@ -376,29 +440,7 @@ def main(argv: list[str] | None = None) -> None:
 
     args = parser.parse_args(argv)
 
-    bridges: list[DiscoveredBridge] = []
-    import concurrent.futures
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=3) as ex:
-        futures: list[concurrent.futures.Future[list[DiscoveredBridge]]] = []
-        if not args.no_ssdp:
-            futures.append(ex.submit(ssdp_discover, timeout_seconds=args.timeout_seconds))
-        if not args.no_mdns:
-            futures.append(ex.submit(mdns_discover, timeout_seconds=args.timeout_seconds))
-        if args.scan_cidr:
-            futures.append(
-                ex.submit(
-                    ip_scan_description_xml,
-                    cidr=args.scan_cidr,
-                    timeout=args.scan_timeout,
-                    concurrency=args.scan_concurrency,
-                )
-            )
-        for f in futures:
-            try:
-                bridges.extend(f.result())
-            except Exception:
-                continue
+    bridges = _run(_discover_all(args))
 
     # De-dupe by IP, prefer enriched/with location.
     by_ip: dict[str, DiscoveredBridge] = {}
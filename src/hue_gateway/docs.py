@@ -0,0 +1,144 @@
+"""OpenAPI prose and examples for the v1 routes, kept out of app.py so the route table stays readable."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+APP_DESCRIPTION: Final[str] = (
+    "# Hue Gateway API\n\n"
+    "LAN-only Hue Bridge gateway for agentic tool calling.\n\n"
+    "## Auth\n"
+    "All `/v1/*` and `/v2/*` endpoints require **one** of:\n\n"
+    "- `Authorization: Bearer <token>`\n"
+    "- `X-API-Key: <key>`\n\n"
+    "Auth errors:\n"
+    "- v1: **401** `{ \"detail\": {\"error\":\"unauthorized\"} }`\n"
+    "- v2: **401** canonical envelope `{ \"ok\": false, \"error\": {\"code\":\"unauthorized\", ...} }`\n\n"
+    "## Key concepts\n"
+    "- The Hue Bridge is on your LAN and is addressed by `HUE_BRIDGE_HOST` (stored in gateway DB via `bridge.set_host`).\n"
+    "- The Hue application key is created by pressing the physical bridge button and calling `bridge.pair`.\n"
+    "- Most Hue v2 operations are available via `clipv2.request` pass-through.\n"
+    "- For convenience, the gateway also provides high-level actions (`light.set`, `grouped_light.set`, `scene.activate`).\n\n"
+    "## Endpoints\n"
+    "- `GET /healthz` liveness\n"
+    "- `GET /readyz` readiness (bridge host + app key + connectivity)\n"
+    "- `POST /v1/actions` **single action endpoint** (typed request/response via `action` discriminator)\n"
+    "- `GET /v1/events/stream` SSE stream of normalized events\n\n"
+    "- `POST /v2/actions` v2 action endpoint (canonical envelopes, idempotency, verify)\n"
+    "- `GET /v2/events/stream` v2 SSE stream (cursor resume via `Last-Event-ID`)\n\n"
+    "## `/v1/actions` cookbook\n"
+    "All requests use the same envelope:\n\n"
+    "```json\n"
+    "{ \"requestId\": \"optional\", \"action\": \"...\", \"args\": { } }\n"
+    "```\n\n"
+    "### 1) Set the bridge host\n"
+    "```json\n"
+    "{ \"action\": \"bridge.set_host\", \"args\": { \"bridgeHost\": \"192.168.1.29\" } }\n"
+    "```\n\n"
+    "### 2) Pair (press the bridge button first)\n"
+    "```json\n"
+    "{ \"action\": \"bridge.pair\", \"args\": { \"devicetype\": \"hue-gateway#docker\" } }\n"
+    "```\n"
+    "If the button was not pressed recently: **409** with `error.code=link_button_not_pressed`.\n\n"
+    "### 3) List rooms (CLIP v2 pass-through)\n"
+    "```json\n"
+    "{ \"action\": \"clipv2.request\", \"args\": { \"method\": \"GET\", \"path\": \"/clip/v2/resource/room\" } }\n"
+    "```\n\n"
+    "### 4) Turn off a room/zone (grouped light)\n"
+    "Get the grouped light rid from the room resource (`services[].rtype == \"grouped_light\"`).\n"
+    "```json\n"
+    "{ \"action\": \"grouped_light.set\", \"args\": { \"rid\": \"<grouped_light_rid>\", \"on\": false } }\n"
+    "```\n\n"
+    "### 5) Turn on a light by name\n"
+    "```json\n"
+    "{ \"action\": \"light.set\", \"args\": { \"name\": \"Kitchen\", \"on\": true, \"brightness\": 30, \"colorTempK\": 2700 } }\n"
+    "```\n"
+    "If the name is ambiguous: **409** with `error.code=ambiguous_name` and a candidate list.\n\n"
+    "### 6) Activate a scene\n"
+    "```json\n"
+    "{ \"action\": \"scene.activate\", \"args\": { \"name\": \"Relax\" } }\n"
+    "```\n\n"
+    "## Common errors\n"
+    "- **400** invalid JSON / invalid args / unknown action (gateway returns a standard error envelope)\n"
+    "- **409** link button not pressed, or ambiguous name resolution\n"
+    "- **424** bridge unreachable (network/connectivity)\n"
+    "- **429** gateway rate limited: `{ \"error\": \"rate_limited\" }`\n"
+    "- **502** bridge returned a non-2xx error\n\n"
+    "## Events (SSE)\n"
+    "`GET /v1/events/stream` returns `text/event-stream`.\n\n"
+    "Clients should keep the connection open and reconnect on disconnect. The gateway may send keepalive\n"
+    "comment frames (`: keepalive`). Each event is emitted as a single `data: <json>` frame.\n"
+)
+
+
+READYZ_DESCRIPTION: Final[str] = (
+    "Returns `ready=true` when the gateway has a bridge host + application key and can reach the Hue Bridge.\n\n"
+    "Common not-ready reasons:\n"
+    "- `missing_bridge_host`\n"
+    "- `missing_application_key`\n"
+    "- `bridge_unreachable`\n"
+    "- `bridge_error`\n"
+)
+
+
+ACTIONS_DESCRIPTION: Final[str] = (
+    "Execute one action.\n\n"
+    "This endpoint is intentionally *generic* for LLM tool calling. The `action` string selects "
+    "the operation, and `args` carries action-specific parameters.\n\n"
+    "Supported actions (v1):\n\n"
+    "- `bridge.set_host`: persist the Hue Bridge host/IP in the gateway.\n"
+    "  - args: `{ \"bridgeHost\": \"192.168.1.29\" }`\n\n"
+    "- `bridge.pair`: create/store a Hue application key (press the bridge button first).\n"
+    "  - args: `{ \"devicetype\": \"hue-gateway#docker\" }` (optional)\n"
+    "  - on success result: `{ \"applicationKey\": \"...\", \"stored\": true }`\n"
+    "  - if button not pressed: `409` with `error.code=link_button_not_pressed`\n\n"
+    "- `clipv2.request`: CLIP v2 pass-through for advanced use.\n"
+    "  - args: `{ \"method\": \"GET\", \"path\": \"/clip/v2/resource/room\", \"body\": {..} }`\n"
+    "  - safety: `path` must start with `/clip/v2/` and cannot override host.\n\n"
+    "- `resolve.by_name`: fuzzy name → rid resolution using cached/indexed names.\n"
+    "  - args: `{ \"rtype\": \"light\", \"name\": \"Kitchen\" }`\n"
+    "  - may return `409` `ambiguous_name` with candidates.\n\n"
+    "- `light.set`: control a light by `rid` or fuzzy `name`.\n"
+    "  - args include any of: `on`, `brightness` (0-100), `colorTempK`, `xy`.\n\n"
+    "- `grouped_light.set`: control a room/zone grouped light by `rid` or fuzzy `name`.\n\n"
+    "- `scene.activate`: activate a scene by `rid` or fuzzy `name`.\n\n"
+    "Notes:\n"
+    "- Some actions depend on the Hue Bridge inventory and device capabilities.\n"
+    "- Rate limiting: `429` returns `{ \"error\": \"rate_limited\" }`.\n"
+)
+
+
+ACTIONS_EXAMPLES: Final[dict[str, Any]] = {
+    "bridge_set_host": {
+        "summary": "Set bridge host (store in gateway)",
+        "value": {"action": "bridge.set_host", "args": {"bridgeHost": "192.168.1.29"}},
+    },
+    "bridge_pair": {
+        "summary": "Pair after pressing the Hue Bridge button",
+        "value": {"action": "bridge.pair", "args": {"devicetype": "hue-gateway#docker"}},
+    },
+    "list_rooms": {
+        "summary": "List rooms via CLIP v2 pass-through",
+        "value": {
+            "action": "clipv2.request",
+            "args": {"method": "GET", "path": "/clip/v2/resource/room"},
+        },
+    },
+    "turn_off_grouped_light": {
+        "summary": "Turn off a room/zone grouped light (by rid)",
+        "value": {"action": "grouped_light.set", "args": {"rid": "<rid>", "on": False}},
+    },
+}
+
+
+EVENTS_STREAM_DESCRIPTION: Final[str] = (
+    "Server-Sent Events (SSE) stream of normalized Hue change events.\n\n"
+    "Response is `text/event-stream` where each event is sent as a single `data: <json>` frame.\n"
+    "The gateway may also send `: keepalive` comment frames.\n\n"
+    "Clients should:\n"
+    "- keep the HTTP connection open\n"
+    "- reconnect on disconnect\n"
+    "- treat event `data` as best-effort (shape may evolve)\n"
+    "- resync state when they receive `{\"type\":\"overflow\",\"dropped\":N}` (events were dropped "
+    "because the client fell behind)\n"
+)
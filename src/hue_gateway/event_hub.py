@@ -1,44 +1,97 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+import orjson
 
-@dataclass(frozen=True)
+
+_DATA_PREFIX = b"data: "
+_FRAME_END = b"\n\n"
+
+# Consecutive publishes that find a disconnect_when_slow subscriber's queue still full before
+# it is dropped; a client that stalls this long is better served by reconnecting.
+_SLOW_SUBSCRIBER_STREAK = 5
+
+
+class HubEvent:
+    """
+    A published event shared by all subscribers. The SSE frame is encoded on first use and reused,
+    so an event is serialized once no matter how many streams it fans out to.
+    """
+
+    __slots__ = ("data", "_frame")
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.data = data
+        self._frame: bytes | None = None
+
+    @property
+    def frame(self) -> bytes:
+        if self._frame is None:
+            self._frame = sse_data_frame(self.data)
+        return self._frame
+
+
+def sse_data_frame(data: Any) -> bytes:
+    return _DATA_PREFIX + orjson.dumps(data) + _FRAME_END
+
+
+@dataclass(eq=False)
 class Subscription:
-    queue: "asyncio.Queue[dict[str, Any]]"
+    queue: "asyncio.Queue[HubEvent]"
     unsubscribe: callable
+    # Events discarded (drop-oldest) because this subscriber fell behind; consumers may reset it.
+    dropped: int = field(default=0)
+    disconnect_when_slow: bool = field(default=False)
+    # Set once the hub has dropped this subscriber; nothing is queued after that.
+    closed: bool = field(default=False)
+    overflow_streak: int = field(default=0)
 
 
 class EventHub:
-    def __init__(self, *, max_queue_size: int = 200) -> None:
-        self._subscribers: set[asyncio.Queue[dict[str, Any]]] = set()
-        self._max_queue_size = max_queue_size
-        self._lock = asyncio.Lock()
+    def __init__(self, *, max_queue_size: int = 256) -> None:
+        # Copy-on-write: subscribe/unsubscribe swap in a new tuple, so publish can walk the
+        # current one without a lock or a per-event snapshot.
+        self._subscribers: tuple[Subscription, ...] = ()
+        self._max_queue_size = max(1, int(max_queue_size))
 
-    async def subscribe(self) -> Subscription:
-        queue: asyncio.Queue[dict[str, Any]] = asyncio.Queue(maxsize=self._max_queue_size)
-        async with self._lock:
-            self._subscribers.add(queue)
+    async def subscribe(self, *, disconnect_when_slow: bool = False) -> Subscription:
+        queue: asyncio.Queue[HubEvent] = asyncio.Queue(maxsize=self._max_queue_size)
 
         async def _unsubscribe() -> None:
-            async with self._lock:
-                self._subscribers.discard(queue)
+            self._subscribers = tuple(s for s in self._subscribers if s is not subscription)
 
-        return Subscription(queue=queue, unsubscribe=_unsubscribe)
+        subscription = Subscription(queue=queue, unsubscribe=_unsubscribe, disconnect_when_slow=disconnect_when_slow)
+        self._subscribers = self._subscribers + (subscription,)
+        return subscription
 
     async def publish(self, event: dict[str, Any]) -> None:
-        async with self._lock:
-            subscribers = list(self._subscribers)
-        for queue in subscribers:
-            if queue.full():
-                try:
-                    queue.get_nowait()
-                except asyncio.QueueEmpty:
-                    pass
+        # The frame is encoded once, lazily, and the same bytes are shared by every subscriber.
+        item = HubEvent(event)
+        for subscription in self._subscribers:
+            queue = subscription.queue
             try:
-                queue.put_nowait(event)
+                queue.put_nowait(item)
+                subscription.overflow_streak = 0
+                continue
             except asyncio.QueueFull:
                 pass
-
+            subscription.overflow_streak += 1
+            if subscription.disconnect_when_slow and subscription.overflow_streak >= _SLOW_SUBSCRIBER_STREAK:
+                # Stop paying get+put per event for a consumer that is not reading.
+                subscription.dropped += 1
+                subscription.closed = True
+                self._subscribers = tuple(s for s in self._subscribers if s is not subscription)
+                continue
+            # Slow consumer: drop the oldest event to keep memory per subscriber bounded.
+            try:
+                queue.get_nowait()
+                subscription.dropped += 1
+            except asyncio.QueueEmpty:
+                pass
+            try:
+                queue.put_nowait(item)
+            except asyncio.QueueFull:
+                subscription.dropped += 1
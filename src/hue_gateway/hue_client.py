@@ -1,11 +1,38 @@
 from __future__ import annotations
 
+import asyncio
+import importlib.util
+import logging
+import random
+import weakref
 from dataclasses import dataclass
-from typing import Any
+from functools import lru_cache
+from typing import Any, AsyncIterator
 
 import httpx
-import asyncio
-import random
+import orjson
+
+from hue_gateway import __version__
+
+
+# One pooled keep-alive client is shared by every bridge call; the SSE stream holds one connection.
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=30.0)
+# HTTP/2 multiplexes concurrent requests over one TLS session; needs the optional `h2` package.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+_SSE_DATA = b"data:"
+_SSE_DATA_LEN = len(_SSE_DATA)
+# Leading whitespace dropped from a data value (what bytes.lstrip() strips, minus LF).
+_SSE_VALUE_WS = b" \t\r\x0b\x0c"
+# Upper bound for one event's data (and for a single unterminated line); larger events are dropped.
+_SSE_MAX_EVENT_BYTES = 4 * 1024 * 1024
+# Events decoded from one read before explicitly yielding to the event loop.
+_SSE_EVENTS_PER_YIELD = 32
+
+_USER_AGENT = f"hue-gateway/{__version__}"
+_BACKOFF_CAP_SECONDS = 5.0
+
+logger = logging.getLogger("hue_gateway")
 
 
 class HueTransportError(Exception):
@@ -35,29 +62,45 @@ class HueClient:
     ) -> None:
         self._bridge_host = bridge_host
         self._application_key = application_key
+        self._headers = _client_headers(application_key)
         self._transport = transport
-        self._client: httpx.AsyncClient | None = None
+        # One pooled client per event loop: httpx connections belong to the loop that opened them,
+        # so a loop never borrows (or invalidates) another loop's pool. Entries vanish with the loop.
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        # Clients replaced by configure(); closed from the event loop on the next request or close().
+        self._retired: list[httpx.AsyncClient] = []
+        # Backoff jitter only; a private PRNG keeps retries off the shared module-level state.
+        self._rng = random.Random()
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self._close_retired()
+        client = self._clients.pop(asyncio.get_running_loop(), None)
+        # Clients of other (finished) loops cannot be closed from here; drop them with their loop.
+        self._clients.clear()
+        if client:
+            await client.aclose()
+
+    async def _close_retired(self) -> None:
+        retired, self._retired = self._retired, []
+        for client in retired:
+            try:
+                await client.aclose()
+            except Exception:
+                pass
 
     def configure(self, *, bridge_host: str | None, application_key: str | None) -> None:
         changed = (bridge_host != self._bridge_host) or (application_key != self._application_key)
         self._bridge_host = bridge_host
-        self._application_key = application_key
-        if changed and self._client:
-            # Lazily recreated on next request.
-            old = self._client
-            self._client = None
-            try:
-                # Best-effort: closing is async, but we don't want to block here.
-                import asyncio
-
-                asyncio.create_task(old.aclose())
-            except RuntimeError:
-                pass
+        if application_key != self._application_key:
+            self._application_key = application_key
+            self._headers = _client_headers(application_key)
+        if changed and self._clients:
+            # Lazily recreated on next request. Only a changed host/key drops the pool, so steady
+            # polling keeps its keep-alive connections (and TLS sessions) for the process lifetime.
+            self._retired.extend(self._clients.values())
+            self._clients.clear()
 
     @property
     def bridge_host(self) -> str | None:
@@ -73,19 +116,23 @@ class HueClient:
         return f"https://{self._bridge_host}"
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client:
-            return self._client
-        headers = {}
-        if self._application_key:
-            headers["hue-application-key"] = self._application_key
-        self._client = httpx.AsyncClient(
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is not None:
+            return client
+        client = httpx.AsyncClient(
             base_url=self._base_url(),
             verify=False,
             timeout=httpx.Timeout(10.0, connect=3.0),
-            headers=headers,
+            headers=self._headers,
+            limits=_POOL_LIMITS,
+            http2=_HTTP2_AVAILABLE,
             transport=self._transport,
         )
-        return self._client
+        self._clients[loop] = client
+        if self._retired:
+            await self._close_retired()
+        return client
 
     async def request_jsonish(
         self,
@@ -117,8 +164,8 @@ class HueClient:
             content_type = resp.headers.get("content-type", "")
             if "application/json" in content_type:
                 try:
-                    body = resp.json()
-                except ValueError:
+                    body = orjson.loads(resp.content)
+                except orjson.JSONDecodeError:
                     body = resp.text
             else:
                 body = resp.text
@@ -142,9 +189,9 @@ class HueClient:
 
     async def _sleep_backoff(self, *, attempt: int, base_delay_ms: int) -> None:
         # Exponential backoff with jitter.
-        delay = (base_delay_ms / 1000.0) * (2 ** (attempt - 1))
-        delay = delay * (0.5 + random.random())
-        await asyncio.sleep(min(delay, 5.0))
+        table = _backoff_table(base_delay_ms)
+        delay = table[min(attempt, len(table)) - 1] * (0.5 + self._rng.random())
+        await asyncio.sleep(min(delay, _BACKOFF_CAP_SECONDS))
 
     async def get_json(self, path: str) -> Any:
         result = await self.request_jsonish(method="GET", path=path)
@@ -163,20 +210,120 @@ class HueClient:
                     body = await resp.aread()
                     raise HueUpstreamError(status_code=resp.status_code, body=body.decode("utf-8", "ignore"))
 
-                data_lines: list[str] = []
-                async for line in resp.aiter_lines():
-                    if line == "":
-                        if data_lines:
-                            payload = "\n".join(data_lines)
-                            data_lines = []
-                            try:
-                                import json as _json
-
-                                yield _json.loads(payload)
-                            except Exception:
-                                continue
+                async for payload in _iter_sse_data(resp.aiter_bytes()):
+                    try:
+                        yield orjson.loads(payload)
+                    except Exception:
                         continue
-                    if line.startswith("data:"):
-                        data_lines.append(line[len("data:") :].lstrip())
         except (httpx.ConnectError, httpx.ConnectTimeout, httpx.ReadTimeout, httpx.NetworkError) as exc:
             raise HueTransportError(str(exc)) from exc
+
+
+@lru_cache(maxsize=8)
+def _backoff_table(base_delay_ms: int) -> tuple[float, ...]:
+    """
+    Un-jittered delay per attempt (base * 2**(attempt - 1)), ending at the first entry that the cap
+    clips even at the lowest jitter; later attempts reuse that last entry.
+    """
+    delay = max(0.0, base_delay_ms / 1000.0)
+    delays = [delay]
+    while 0.0 < delay * 0.5 < _BACKOFF_CAP_SECONDS:
+        delay *= 2
+        delays.append(delay)
+    return tuple(delays)
+
+
+def _client_headers(application_key: str | None) -> dict[str, str]:
+    headers = {"User-Agent": _USER_AGENT}
+    if application_key:
+        headers["hue-application-key"] = application_key
+    return headers
+
+
+async def _lf_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    # SSE lines may end in CRLF or a lone CR; rewrite both to LF. A chunk ending in CR is held
+    # back one byte because the LF of a CRLF may open the next chunk.
+    pending_cr = False
+    async for chunk in chunks:
+        if pending_cr:
+            chunk = b"\r" + chunk
+            pending_cr = False
+        if b"\r" in chunk:
+            if chunk.endswith(b"\r"):
+                chunk = chunk[:-1]
+                pending_cr = True
+            chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        if chunk:
+            yield chunk
+    if pending_cr:
+        yield b"\n"
+
+
+async def _iter_sse_data(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytearray]:
+    """
+    Incremental SSE decoder over raw bytes: yields the joined `data:` payload of each event.
+
+    Lines are split in one reusable buffer and nothing is decoded to str, so an event costs one
+    payload copy instead of a decoded string per line plus a join. Lines end in LF, CRLF or a lone
+    CR (normalized to LF per chunk); comment and non-data fields are skipped.
+    """
+    buf = bytearray()
+    payload = bytearray()
+    has_data = False
+    # Oversized input: skip_line discards bytes up to the next LF, skip_event discards data lines
+    # up to the next blank line. Memory stays bounded whatever the upstream sends.
+    skip_line = False
+    skip_event = False
+    async for chunk in _lf_chunks(chunks):
+        if skip_line:
+            nl = chunk.find(b"\n")
+            if nl < 0:
+                continue
+            chunk = chunk[nl + 1 :]
+            skip_line = False
+        buf += chunk
+        start = 0
+        burst = 0
+        # Values are copied straight out of the buffer through one view per chunk; the view is
+        # released before the consumed prefix is deleted.
+        with memoryview(buf) as view:
+            while (nl := buf.find(b"\n", start)) >= 0:
+                end = nl
+                if end == start:
+                    if skip_event:
+                        skip_event = False
+                    elif has_data:
+                        yield payload
+                        payload = bytearray()
+                        has_data = False
+                        burst += 1
+                        if burst >= _SSE_EVENTS_PER_YIELD:
+                            # Bounded fairness for large reads; normally the socket read yields.
+                            burst = 0
+                            await asyncio.sleep(0)
+                elif skip_event:
+                    pass
+                elif buf.startswith(_SSE_DATA, start, end):
+                    value = start + _SSE_DATA_LEN
+                    while value < end and buf[value] in _SSE_VALUE_WS:
+                        value += 1
+                    if len(payload) + end - value >= _SSE_MAX_EVENT_BYTES:
+                        logger.warning("Dropping bridge SSE event over %d bytes", _SSE_MAX_EVENT_BYTES)
+                        payload = bytearray()
+                        has_data = False
+                        skip_event = True
+                    else:
+                        if has_data:
+                            payload += b"\n"
+                        payload += view[value:end]
+                        has_data = True
+                start = nl + 1
+        if start:
+            del buf[:start]
+        if len(buf) > _SSE_MAX_EVENT_BYTES:
+            logger.warning("Dropping bridge SSE line over %d bytes", _SSE_MAX_EVENT_BYTES)
+            buf.clear()
+            payload = bytearray()
+            has_data = False
+            skip_line = True
+            skip_event = True
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import time
+from functools import lru_cache
 from typing import Any
 
+import orjson
+
 from hue_gateway.cache import ResourceCache
 from hue_gateway.db import Database
 from hue_gateway.event_hub import EventHub
@@ -13,6 +15,20 @@ from hue_gateway.hue_client import HueClient, HueTransportError, HueUpstreamErro
 
 CORE_RESOURCE_TYPES = ["device", "light", "room", "zone", "grouped_light", "scene"]
 
+# Concurrent per-resource GETs while ingesting one bridge SSE message.
+_DETAIL_FETCH_CONCURRENCY = 4
+
+
+@lru_cache(maxsize=1)
+def _utc_timestamp(epoch_seconds: int) -> str:
+    # Events within the same second share one formatted string.
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch_seconds))
+
+
+def _dump_resource(resource: dict[str, Any]) -> str:
+    # orjson's default output is already the compact, non-ASCII-escaped form stored before.
+    return orjson.dumps(resource).decode()
+
 
 def _extract_name(resource: dict[str, Any]) -> str | None:
     metadata = resource.get("metadata")
@@ -24,8 +40,20 @@ def _extract_name(resource: dict[str, Any]) -> str | None:
 
 
 async def sync_core_resources(*, db: Database, hue: HueClient, cache: ResourceCache) -> None:
-    for rtype in CORE_RESOURCE_TYPES:
-        payload = await hue.get_json(f"/clip/v2/resource/{rtype}")
+    # The per-type GETs are independent: fetch them together so a resync costs the slowest
+    # round-trip rather than the sum of all six.
+    payloads = await asyncio.gather(
+        *(hue.get_json(f"/clip/v2/resource/{rtype}") for rtype in CORE_RESOURCE_TYPES),
+        return_exceptions=True,
+    )
+    # One failing type must not hold back the others: store every type that came back, then
+    # surface the first failure to the caller.
+    failures = [payload for payload in payloads if isinstance(payload, BaseException)]
+    if len(failures) == len(payloads):
+        raise failures[0]
+
+    rows: list[tuple[str, str, str | None, str]] = []
+    for rtype, payload in zip(CORE_RESOURCE_TYPES, payloads):
         data = payload.get("data") if isinstance(payload, dict) else None
         if not isinstance(data, list):
             continue
@@ -36,18 +64,14 @@ async def sync_core_resources(*, db: Database, hue: HueClient, cache: ResourceCa
             if not isinstance(rid, str) or not rid:
                 continue
             name = _extract_name(item)
-            await db.upsert_resource(
-                rid=rid,
-                rtype=rtype,
-                name=name,
-                json_text=json.dumps(item, separators=(",", ":"), ensure_ascii=False),
-                updated_at=int(time.time()),
-            )
+            rows.append((rid, rtype, name, _dump_resource(item)))
             cache.upsert(rid=rid, rtype=rtype, name=name, data=item)
 
-    await db.commit()
-    await db.rebuild_name_index()
+    # One executemany and one commit for the whole inventory.
+    await db.upsert_resources(rows)
     await db.increment_setting_int("inventory_revision")
+    if failures:
+        raise failures[0]
 
 
 async def resync_loop(*, db: Database, hue: HueClient, cache: ResourceCache, seconds: int) -> None:
@@ -104,6 +128,8 @@ async def _process_bridge_event_message(
     else:
         events = [msg]
 
+    # (rid, rtype, is_delete) in message order.
+    refs: list[tuple[str, str, bool]] = []
     for event in events:
         if not isinstance(event, dict):
             continue
@@ -119,57 +145,80 @@ async def _process_bridge_event_message(
             rtype = ref.get("type")
             if not isinstance(rid, str) or not isinstance(rtype, str):
                 continue
+            refs.append((rid, rtype, event_type in {"delete", "remove"}))
+
+    # Fetch full resources to avoid persisting partial SSE payloads. The GETs run concurrently but
+    # bounded, so a burst costs a few bridge round-trips rather than one per ref.
+    semaphore = asyncio.Semaphore(_DETAIL_FETCH_CONCURRENCY)
+
+    async def _fetch(rid: str, rtype: str) -> Any:
+        async with semaphore:
+            return await hue.get_json(f"/clip/v2/resource/{rtype}/{rid}")
+
+    fetched = await asyncio.gather(
+        *(_fetch(rid, rtype) for rid, rtype, is_delete in refs if not is_delete),
+        return_exceptions=True,
+    )
+    for result in fetched:
+        # Surface the first failure as the serial loop did (transport errors trigger a resync).
+        if isinstance(result, BaseException):
+            raise result
+
+    # (rid, rtype, resource, name); resource is None for a deletion. Applied in order, one commit.
+    changes: list[tuple[str, str, dict[str, Any] | None, str | None]] = []
+    deleted: set[str] = set()
+    results = iter(fetched)
+    for rid, rtype, is_delete in refs:
+        if is_delete:
+            changes.append((rid, rtype, None, None))
+            deleted.add(rid)
+            continue
+        full = next(results)
+        resource_list = full.get("data") if isinstance(full, dict) else None
+        if not isinstance(resource_list, list) or not resource_list:
+            continue
+        resource = resource_list[0]
+        if not isinstance(resource, dict):
+            continue
+        cached = cache.get(rid)
+        unchanged = cached is not None and cached.rtype == rtype and cached.data == resource
+        if unchanged and rid not in deleted:
+            # Duplicate/idempotent bridge event: DB, cache and subscribers are already current.
+            continue
+        changes.append((rid, rtype, resource, _extract_name(resource)))
 
-            if event_type in {"delete", "remove"}:
+    if not changes:
+        return
+
+    now = int(time.time())
+    async with db.transaction():
+        for rid, rtype, resource, name in changes:
+            if resource is None:
                 await db.delete_resource(rid)
-                await db.commit()
-                if rtype in CORE_RESOURCE_TYPES:
-                    await db.increment_setting_int("inventory_revision")
-                cache.delete(rid=rid)
-                await hub.publish(
-                    {
-                        "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                        "source": "hue-bridge",
-                        "type": "resource.deleted",
-                        "resource": {"rid": rid, "rtype": rtype},
-                        "data": {},
-                    }
+            else:
+                await db.upsert_resource(
+                    rid=rid,
+                    rtype=rtype,
+                    name=name,
+                    json_text=_dump_resource(resource),
+                    updated_at=now,
                 )
-                continue
-
-            # Fetch full resource to avoid persisting partial SSE payloads.
-            full = await hue.get_json(f"/clip/v2/resource/{rtype}/{rid}")
-            resource_list = full.get("data") if isinstance(full, dict) else None
-            if not isinstance(resource_list, list) or not resource_list:
-                continue
-            resource = resource_list[0]
-            if not isinstance(resource, dict):
-                continue
-            name = _extract_name(resource)
-            await db.upsert_resource(
-                rid=rid,
-                rtype=rtype,
-                name=name,
-                json_text=json.dumps(resource, separators=(",", ":"), ensure_ascii=False),
-                updated_at=int(time.time()),
-            )
-            await db.commit()
-            await db.delete_name_index_for_rid(rid)
-            if name:
-                name_norm = " ".join(name.strip().lower().split())
-                if name_norm:
-                    await db.insert_name_index(rtype=rtype, name_norm=name_norm, rid=rid)
-                    await db.commit()
-
+    # One revision bump per bridge message: clients only compare revisions for change.
+    if any(rtype in CORE_RESOURCE_TYPES for _, rtype, _, _ in changes):
+        await db.increment_setting_int("inventory_revision")
+
+    ts = _utc_timestamp(now)
+    for rid, rtype, resource, name in changes:
+        if resource is None:
+            cache.delete(rid=rid)
+        else:
             cache.upsert(rid=rid, rtype=rtype, name=name, data=resource)
-            if rtype in CORE_RESOURCE_TYPES:
-                await db.increment_setting_int("inventory_revision")
-            await hub.publish(
-                {
-                    "ts": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-                    "source": "hue-bridge",
-                    "type": "resource.updated",
-                    "resource": {"rid": rid, "rtype": rtype},
-                    "data": {},
-                }
-            )
+        await hub.publish(
+            {
+                "ts": ts,
+                "source": "hue-bridge",
+                "type": "resource.deleted" if resource is None else "resource.updated",
+                "resource": {"rid": rid, "rtype": rtype},
+                "data": {},
+            }
+        )
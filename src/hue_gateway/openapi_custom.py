@@ -1,34 +1,115 @@
 from __future__ import annotations
 
+from typing import Any
+
 from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.openapi.models import Schema
 from fastapi.openapi.utils import get_openapi
+from pydantic import TypeAdapter
+
+from hue_gateway.schemas import ACTION_REQUEST_ADAPTER
+
+
+_V1_ACTION_MAPPING = {
+    "bridge.set_host": "#/components/schemas/BridgeSetHostRequest",
+    "bridge.pair": "#/components/schemas/BridgePairRequest",
+    "clipv2.request": "#/components/schemas/ClipV2Request",
+    "resolve.by_name": "#/components/schemas/ResolveByNameRequest",
+    "light.set": "#/components/schemas/LightSetRequest",
+    "grouped_light.set": "#/components/schemas/GroupedLightSetRequest",
+    "scene.activate": "#/components/schemas/SceneActivateRequest",
+}
+
+_V2_ACTION_MAPPING = {
+    "bridge.set_host": "#/components/schemas/V2BridgeSetHostRequest",
+    "bridge.pair": "#/components/schemas/V2BridgePairRequest",
+    "clipv2.request": "#/components/schemas/V2ClipV2Request",
+    "resolve.by_name": "#/components/schemas/V2ResolveByNameRequest",
+    "light.set": "#/components/schemas/V2LightSetRequest",
+    "grouped_light.set": "#/components/schemas/V2GroupedLightSetRequest",
+    "scene.activate": "#/components/schemas/V2SceneActivateRequest",
+    "room.set": "#/components/schemas/V2RoomSetRequest",
+    "zone.set": "#/components/schemas/V2ZoneSetRequest",
+    "inventory.snapshot": "#/components/schemas/V2InventorySnapshotRequest",
+    "actions.batch": "#/components/schemas/V2ActionsBatchRequest",
+}
+
+
+def _dig(node: Any, *keys: str) -> Any:
+    """
+    Walk nested schema dicts; None as soon as a key is missing or a level is not a dict.
+    """
+    for key in keys:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def _drop_422(schema: dict[str, Any], path: str) -> None:
+    # Remove auto-added 422 responses for endpoints where we normalize validation errors into 400.
+    responses = _dig(schema, "paths", path, "post", "responses")
+    if isinstance(responses, dict):
+        responses.pop("422", None)
+
+
+def _event_stream_only(schema: dict[str, Any], path: str) -> None:
+    # Ensure SSE endpoint advertises text/event-stream (not JSON).
+    content = _dig(schema, "paths", path, "get", "responses", "200", "content")
+    if isinstance(content, dict):
+        content.pop("application/json", None)
+
+
+def _one_of(json_schema: Any) -> bool:
+    """
+    Convert anyOf -> oneOf in place (better client generation). Returns True if converted.
+    """
+    if not isinstance(json_schema, dict):
+        return False
+    any_of = json_schema.get("anyOf")
+    if isinstance(any_of, list) and any_of:
+        json_schema.pop("anyOf", None)
+        json_schema["oneOf"] = any_of
+        return True
+    return False
+
+
+def _openapi_schema(json_schema: dict[str, Any]) -> dict[str, Any]:
+    # Normalize like get_openapi() does (OpenAPI Schema model, exclude_none) so the injected
+    # schemas are byte-identical to ones FastAPI would have generated for a declared body.
+    return jsonable_encoder(Schema.model_validate(json_schema), by_alias=True, exclude_none=True)
+
+
+def _request_body_schema(schema: dict[str, Any], path: str, adapter: TypeAdapter[Any]) -> None:
+    # Routes that validate the raw body themselves declare only examples via openapi_extra;
+    # publish the adapter's schema (and its component models) the way FastAPI would have.
+    content = _dig(schema, "paths", path, "post", "requestBody", "content", "application/json")
+    if not isinstance(content, dict):
+        return
+    body_schema = adapter.json_schema(ref_template="#/components/schemas/{model}")
+    components = schema.setdefault("components", {}).setdefault("schemas", {})
+    for name, definition in body_schema.pop("$defs", {}).items():
+        components.setdefault(name, _openapi_schema(definition))
+    content["schema"] = _openapi_schema({"title": "Payload", **body_schema})
+
+
+def _tighten_actions_request(schema: dict[str, Any], path: str, mapping: dict[str, str]) -> None:
+    # Tighten the actions request schema to `oneOf` + discriminator.
+    request_body = _dig(schema, "paths", path, "post", "requestBody")
+    req_schema = _dig(request_body, "content", "application/json", "schema")
+    if _one_of(req_schema):
+        req_schema["discriminator"] = {"propertyName": "action", "mapping": dict(mapping)}
+
+
+def _tighten_actions_responses(schema: dict[str, Any], path: str, codes: tuple[str, ...]) -> None:
+    # Tighten the actions 2xx response schemas from anyOf -> oneOf if possible.
+    responses = _dig(schema, "paths", path, "post", "responses")
+    for code in codes:
+        _one_of(_dig(responses, code, "content", "application/json", "schema"))
 
 
 def install_custom_openapi(app: FastAPI) -> None:
-    action_mapping = {
-        "bridge.set_host": "#/components/schemas/BridgeSetHostRequest",
-        "bridge.pair": "#/components/schemas/BridgePairRequest",
-        "clipv2.request": "#/components/schemas/ClipV2Request",
-        "resolve.by_name": "#/components/schemas/ResolveByNameRequest",
-        "light.set": "#/components/schemas/LightSetRequest",
-        "grouped_light.set": "#/components/schemas/GroupedLightSetRequest",
-        "scene.activate": "#/components/schemas/SceneActivateRequest",
-    }
-
-    v2_action_mapping = {
-        "bridge.set_host": "#/components/schemas/V2BridgeSetHostRequest",
-        "bridge.pair": "#/components/schemas/V2BridgePairRequest",
-        "clipv2.request": "#/components/schemas/V2ClipV2Request",
-        "resolve.by_name": "#/components/schemas/V2ResolveByNameRequest",
-        "light.set": "#/components/schemas/V2LightSetRequest",
-        "grouped_light.set": "#/components/schemas/V2GroupedLightSetRequest",
-        "scene.activate": "#/components/schemas/V2SceneActivateRequest",
-        "room.set": "#/components/schemas/V2RoomSetRequest",
-        "zone.set": "#/components/schemas/V2ZoneSetRequest",
-        "inventory.snapshot": "#/components/schemas/V2InventorySnapshotRequest",
-        "actions.batch": "#/components/schemas/V2ActionsBatchRequest",
-    }
-
     def custom_openapi():
         if app.openapi_schema:
             return app.openapi_schema
@@ -40,85 +121,15 @@ def install_custom_openapi(app: FastAPI) -> None:
             routes=app.routes,
         )
 
-        # Remove auto-added 422 responses for endpoints where we normalize validation errors into 400.
-        try:
-            actions_post = schema["paths"]["/v1/actions"]["post"]
-            actions_post.get("responses", {}).pop("422", None)
-        except Exception:
-            pass
-
-        try:
-            actions_post = schema["paths"]["/v2/actions"]["post"]
-            actions_post.get("responses", {}).pop("422", None)
-        except Exception:
-            pass
-
-        # Ensure SSE endpoint advertises text/event-stream (not JSON).
-        try:
-            ev_get = schema["paths"]["/v1/events/stream"]["get"]
-            content = ev_get.get("responses", {}).get("200", {}).get("content", {})
-            if isinstance(content, dict):
-                content.pop("application/json", None)
-        except Exception:
-            pass
-
-        try:
-            ev_get = schema["paths"]["/v2/events/stream"]["get"]
-            content = ev_get.get("responses", {}).get("200", {}).get("content", {})
-            if isinstance(content, dict):
-                content.pop("application/json", None)
-        except Exception:
-            pass
-
-        # Tighten /v1/actions request schema to `oneOf` + discriminator.
-        try:
-            actions_post = schema["paths"]["/v1/actions"]["post"]
-            req_schema = (
-                actions_post["requestBody"]["content"]["application/json"]["schema"]
-            )
-            any_of = req_schema.get("anyOf")
-            if isinstance(any_of, list) and any_of:
-                # Convert anyOf -> oneOf for better client generation, and add discriminator mapping.
-                req_schema.pop("anyOf", None)
-                req_schema["oneOf"] = any_of
-                req_schema["discriminator"] = {"propertyName": "action", "mapping": action_mapping}
-        except Exception:
-            pass
-
-        # Tighten /v2/actions request schema to `oneOf` + discriminator.
-        try:
-            actions_post = schema["paths"]["/v2/actions"]["post"]
-            req_schema = actions_post["requestBody"]["content"]["application/json"]["schema"]
-            any_of = req_schema.get("anyOf")
-            if isinstance(any_of, list) and any_of:
-                req_schema.pop("anyOf", None)
-                req_schema["oneOf"] = any_of
-                req_schema["discriminator"] = {"propertyName": "action", "mapping": v2_action_mapping}
-        except Exception:
-            pass
-
-        # Tighten /v1/actions 200 response schema from anyOf -> oneOf if possible.
-        try:
-            actions_post = schema["paths"]["/v1/actions"]["post"]
-            resp_schema = actions_post["responses"]["200"]["content"]["application/json"]["schema"]
-            any_of = resp_schema.get("anyOf")
-            if isinstance(any_of, list) and any_of:
-                resp_schema.pop("anyOf", None)
-                resp_schema["oneOf"] = any_of
-        except Exception:
-            pass
-
-        # Tighten /v2/actions 2xx response schema from anyOf -> oneOf if possible.
-        try:
-            actions_post = schema["paths"]["/v2/actions"]["post"]
-            for code in ("200", "207"):
-                resp_schema = actions_post["responses"][code]["content"]["application/json"]["schema"]
-                any_of = resp_schema.get("anyOf")
-                if isinstance(any_of, list) and any_of:
-                    resp_schema.pop("anyOf", None)
-                    resp_schema["oneOf"] = any_of
-        except Exception:
-            pass
+        _request_body_schema(schema, "/v1/actions", ACTION_REQUEST_ADAPTER)
+        _drop_422(schema, "/v1/actions")
+        _drop_422(schema, "/v2/actions")
+        _event_stream_only(schema, "/v1/events/stream")
+        _event_stream_only(schema, "/v2/events/stream")
+        _tighten_actions_request(schema, "/v1/actions", _V1_ACTION_MAPPING)
+        _tighten_actions_request(schema, "/v2/actions", _V2_ACTION_MAPPING)
+        _tighten_actions_responses(schema, "/v1/actions", ("200",))
+        _tighten_actions_responses(schema, "/v2/actions", ("200", "207"))
 
         app.openapi_schema = schema
         return app.openapi_schema
@@ -3,41 +3,79 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 
+# How often idle buckets are swept; the check piggybacks on allow() calls.
+_SWEEP_INTERVAL_NS = 60 * 1_000_000_000
+# A burst of new keys sweeps early instead of waiting for the interval.
+_SWEEP_AT_BUCKETS = 10_000
 
-@dataclass
+# Integer bookkeeping: the rate is held in milli-tokens per second and tokens in pico-tokens, so
+# elapsed_ns * rate lands directly in token units with no float math (or drift) per request.
+_RATE_SCALE = 1_000
+_TOKEN_SCALE = 1_000_000_000_000
+
+
+@dataclass(slots=True)
 class _Bucket:
-    tokens: float
-    updated_at: float
+    tokens: int
+    updated_at: int
 
 
 class TokenBucketLimiter:
     def __init__(self, *, rate_per_sec: float, burst: int) -> None:
-        self._rate = max(0.0, float(rate_per_sec))
-        self._capacity = max(0.0, float(burst))
+        self._rate = max(0, round(float(rate_per_sec) * _RATE_SCALE))
+        self._capacity = max(0, round(float(burst) * _TOKEN_SCALE))
         self._buckets: dict[str, _Bucket] = {}
+        self._next_sweep = time.monotonic_ns() + _SWEEP_INTERVAL_NS
+        self._sweep_at = _SWEEP_AT_BUCKETS
 
     def allow(self, key: str, cost: float = 1.0) -> bool:
         allowed, _ = self.allow_with_retry_after_ms(key, cost=cost)
         return allowed
 
     def allow_with_retry_after_ms(self, key: str, *, cost: float = 1.0) -> tuple[bool, int]:
-        now = time.monotonic()
+        # Single-threaded event loop: the refill and decrement below never interleave,
+        # so no lock is needed.
+        now = time.monotonic_ns()
+        if now >= self._next_sweep:
+            self._sweep(now)
+
         bucket = self._buckets.get(key)
         if bucket is None:
+            if len(self._buckets) >= self._sweep_at:
+                self._sweep(now)
+                # If most buckets are still draining, back off so inserts stay amortized O(1).
+                self._sweep_at = max(_SWEEP_AT_BUCKETS, 2 * len(self._buckets))
             bucket = _Bucket(tokens=self._capacity, updated_at=now)
             self._buckets[key] = bucket
 
-        elapsed = now - bucket.updated_at
+        tokens = min(self._capacity, bucket.tokens + (now - bucket.updated_at) * self._rate)
         bucket.updated_at = now
-        bucket.tokens = min(self._capacity, bucket.tokens + elapsed * self._rate)
 
-        if bucket.tokens >= cost:
-            bucket.tokens -= cost
+        cost_scaled = round(cost * _TOKEN_SCALE) if cost != 1.0 else _TOKEN_SCALE
+        if tokens >= cost_scaled:
+            bucket.tokens = tokens - cost_scaled
             return True, 0
+        bucket.tokens = tokens
 
         # Compute an actionable retry hint.
-        deficit = max(0.0, float(cost) - bucket.tokens)
-        if self._rate <= 0.0:
+        if self._rate <= 0:
             return False, 0
-        retry_after_ms = int((deficit / self._rate) * 1000.0) + 1
+        # pico-tokens / (milli-tokens per second) = nanoseconds until the deficit refills.
+        retry_after_ms = (cost_scaled - tokens) // self._rate // 1_000_000 + 1
         return False, retry_after_ms
+
+    def _sweep(self, now: int) -> None:
+        # A bucket that has refilled to capacity is indistinguishable from a new one,
+        # so dropping it bounds memory for one-off credentials without changing limits.
+        self._next_sweep = now + _SWEEP_INTERVAL_NS
+        if self._rate <= 0:
+            return
+        capacity = self._capacity
+        rate = self._rate
+        idle = [
+            key
+            for key, bucket in self._buckets.items()
+            if bucket.tokens + (now - bucket.updated_at) * rate >= capacity
+        ]
+        for key in idle:
+            del self._buckets[key]
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSONResponse rendered with orjson (bytes out, no stdlib encoder).
+
+    Kept in-repo rather than `fastapi.responses.ORJSONResponse`, which newer FastAPI releases deprecate.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
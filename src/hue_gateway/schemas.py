@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Annotated, Any, Literal, Union
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field, TypeAdapter, WithJsonSchema
 
 
 class HealthResponse(BaseModel):
@@ -55,6 +55,29 @@ class BridgePairRequest(_BaseActionRequest):
     args: BridgePairArgs = Field(default_factory=BridgePairArgs)
 
 
+def _json_container(value: Any) -> Any:
+    if value is None or isinstance(value, (dict, list)):
+        return value
+    raise ValueError("must be a JSON object or array")
+
+
+# CLIP v2 bodies are passed through untouched: check only the top-level shape instead of having
+# `dict[str, Any] | list[Any]` rebuild the container, but advertise the same JSON schema.
+ClipV2Body = Annotated[
+    Any,
+    AfterValidator(_json_container),
+    WithJsonSchema(
+        {
+            "anyOf": [
+                {"additionalProperties": True, "type": "object"},
+                {"items": {}, "type": "array"},
+                {"type": "null"},
+            ]
+        }
+    ),
+]
+
+
 class ClipV2RequestArgs(BaseModel):
     method: Literal["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"] = Field(
         ..., description="HTTP method to use against the Hue Bridge."
@@ -65,7 +88,7 @@ class ClipV2RequestArgs(BaseModel):
         examples=["/clip/v2/resource/room"],
         pattern=r"^/clip/v2/.*",
     )
-    body: dict[str, Any] | list[Any] | None = Field(
+    body: ClipV2Body = Field(
         default=None,
         description="Optional JSON body (object or array) for POST/PUT requests.",
     )
@@ -129,6 +152,8 @@ class SceneActivateRequest(_BaseActionRequest):
     args: SceneActivateArgs
 
 
+# The `action` discriminator makes pydantic-core pick the member model with a single tag lookup
+# (no trial validation against each union member), so per-action adapters would not be faster.
 ActionRequest = Annotated[
     Union[
         BridgeSetHostRequest,
@@ -255,3 +280,17 @@ class RateLimitedResponse(BaseModel):
         "rate_limited",
         description="Gateway rate limit exceeded for the supplied credential.",
     )
+
+
+# Built once at import: constructing a TypeAdapter compiles the union's core schema, which is far
+# more expensive than validating with it.
+ACTION_REQUEST_ADAPTER: TypeAdapter[ActionRequest] = TypeAdapter(ActionRequest)
+ACTION_RESPONSE_ADAPTER: TypeAdapter[ActionSuccessResponse] = TypeAdapter(ActionSuccessResponse)
+
+
+def parse_action_request(raw: bytes) -> ActionRequest:
+    """
+    Parse and validate a raw JSON body in a single pydantic-core pass (no intermediate dict).
+    Raises pydantic.ValidationError for malformed JSON as well as schema violations.
+    """
+    return ACTION_REQUEST_ADAPTER.validate_json(raw)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import hashlib
 import secrets
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import lru_cache
 
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import APIKeyHeader, HTTPAuthorizationCredentials, HTTPBearer
 
+from hue_gateway.config import AppConfig
+
 
 @dataclass(frozen=True)
 class AuthContext:
@@ -13,11 +18,53 @@ class AuthContext:
     scheme: str  # "bearer" | "api_key"
 
 
+# Per-process key: tags are only ever compared in memory, never persisted or sent anywhere.
+_TAG_KEY = secrets.token_bytes(32)
+
+
+def _credential_tag(value: str) -> bytes:
+    return hashlib.blake2b(value.encode("utf-8"), key=_TAG_KEY, digest_size=16).digest()
+
+
+@lru_cache(maxsize=8)
+def _allowed_tags(allowed: tuple[str, ...]) -> frozenset[bytes]:
+    return frozenset(_credential_tag(item) for item in allowed)
+
+
 def _is_allowed(value: str, allowed: list[str]) -> bool:
-    for item in allowed:
-        if secrets.compare_digest(value, item):
-            return True
-    return False
+    # One keyed hash + set lookup instead of a compare_digest per configured credential. The hash
+    # always runs over the whole input and the key is secret, so timing reveals nothing about
+    # how closely a guess matches a real token.
+    return _credential_tag(value) in _allowed_tags(tuple(allowed))
+
+
+# Accepted credentials only, LRU-capped. Entries are tied to the credential lists they were checked
+# against: a config carrying different lists (AppConfig.reload(), a new lifespan) starts afresh.
+_AUTH_CACHE_MAX = 1024
+_auth_cache: OrderedDict[tuple[str, str], AuthContext] = OrderedDict()
+_auth_cache_lists: tuple[list[str], list[str]] | None = None
+
+
+def _authenticate(config: AppConfig, credential: str, scheme: str) -> AuthContext | None:
+    global _auth_cache_lists
+    lists = _auth_cache_lists
+    if lists is None or lists[0] is not config.auth_tokens or lists[1] is not config.api_keys:
+        _auth_cache.clear()
+        _auth_cache_lists = (config.auth_tokens, config.api_keys)
+
+    key = (scheme, credential)
+    auth = _auth_cache.get(key)
+    if auth is not None:
+        _auth_cache.move_to_end(key)
+        return auth
+    allowed = config.auth_tokens if scheme == "bearer" else config.api_keys
+    if not _is_allowed(credential, allowed):
+        return None
+    auth = AuthContext(credential=credential, scheme=scheme)
+    _auth_cache[key] = auth
+    if len(_auth_cache) > _AUTH_CACHE_MAX:
+        _auth_cache.popitem(last=False)
+    return auth
 
 
 _bearer = HTTPBearer(auto_error=False)
@@ -34,11 +81,15 @@ async def require_auth(
 
     if bearer and bearer.scheme.lower() == "bearer":
         token = bearer.credentials.strip()
-        if token and _is_allowed(token, config.auth_tokens):
-            return AuthContext(credential=token, scheme="bearer")
+        if token:
+            auth = _authenticate(config, token, "bearer")
+            if auth is not None:
+                return auth
 
-    if api_key and _is_allowed(api_key, config.api_keys):
-        return AuthContext(credential=api_key, scheme="api_key")
+    if api_key:
+        auth = _authenticate(config, api_key, "api_key")
+        if auth is not None:
+            return auth
 
     raise HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import time
 from dataclasses import dataclass
 from difflib import SequenceMatcher
-from typing import Any
+from operator import itemgetter
+from typing import Any, Callable
 
 from hue_gateway.cache import normalize_name
 from hue_gateway.config import AppConfig
@@ -42,11 +44,30 @@ class V2ActionError(Exception):
 
 
 class V2Dispatcher:
-    def __init__(self, *, db: Database, hue: HueClient, cache: Any, config: AppConfig) -> None:
+    def __init__(
+        self,
+        *,
+        db: Database,
+        hue: HueClient,
+        cache: Any,
+        config: AppConfig,
+        config_changed: asyncio.Event | None = None,
+        invalidate_name_cache: Callable[[], None] | None = None,
+    ) -> None:
         self.db = db
         self.hue = hue
         self.cache = cache
         self.config = config
+        self.config_changed = config_changed
+        # The v1 dispatcher's name/resolve caches hold rids of the current bridge; they must be
+        # dropped when v2 switches or re-pairs the bridge, just like the v1 actions do.
+        self.invalidate_name_cache = invalidate_name_cache
+
+    def _bridge_changed(self) -> None:
+        if self.invalidate_name_cache is not None:
+            self.invalidate_name_cache()
+        if self.config_changed is not None:
+            self.config_changed.set()
 
     async def dispatch(
         self,
@@ -237,6 +258,7 @@ class V2Dispatcher:
             raise V2ActionError(status_code=400, code="invalid_args", message="bridgeHost must be an IP/hostname only")
         await self.db.set_setting("bridge_host", host)
         self.hue.configure(bridge_host=host, application_key=self.hue.application_key)
+        self._bridge_changed()
         return V2HTTPResponse(
             status_code=200,
             body={"requestId": request_id, "action": "bridge.set_host", "ok": True, "result": {"bridgeHost": host, "stored": True}},
@@ -267,6 +289,7 @@ class V2Dispatcher:
                     application_key = success["username"]
                     await self.db.set_setting("application_key", application_key)
                     self.hue.configure(bridge_host=self.hue.bridge_host, application_key=application_key)
+                    self._bridge_changed()
                     return V2HTTPResponse(
                         status_code=200,
                         body={
@@ -316,17 +339,17 @@ class V2Dispatcher:
         for cand_norm, rid, display_name in candidates:
             score = SequenceMatcher(None, query, cand_norm).ratio()
             scored.append((score, rid, display_name))
-        scored.sort(key=lambda x: x[0], reverse=True)
+        # Only the top-2 (threshold/margin) and top-5 (ambiguous details) are needed.
+        top = heapq.nlargest(5, scored, key=itemgetter(0))
 
-        best_score, best_rid, best_name = scored[0]
+        best_score, best_rid, best_name = top[0]
         if best_score >= self.config.fuzzy_match_autopick_threshold:
             return self._ResolvedName(rid=best_rid, name=best_name, confidence=best_score)
 
-        second_score = scored[1][0] if len(scored) > 1 else 0.0
+        second_score = top[1][0] if len(top) > 1 else 0.0
         if best_score >= self.config.fuzzy_match_threshold and (best_score - second_score) >= self.config.fuzzy_match_margin:
             return self._ResolvedName(rid=best_rid, name=best_name, confidence=best_score)
 
-        top = scored[:5]
         raise V2ActionError(
             status_code=409,
             code="ambiguous_name",
@@ -730,9 +753,12 @@ class V2Dispatcher:
             result = {"notModified": True, "revision": int(revision)}
             return V2HTTPResponse(status_code=200, body={"requestId": request_id, "action": "inventory.snapshot", "ok": True, "result": result})
 
-        rooms_raw = await self.db.list_resources(rtype="room")
-        zones_raw = await self.db.list_resources(rtype="zone")
-        lights_raw = await self.db.list_resources(rtype="light")
+        # Rooms and zones are streamed below. Lights are the largest set and only four scalar fields
+        # are used, so project them in SQLite.
+        lights_raw = await self.db.list_resource_fields(
+            rtype="light",
+            paths=["$.id", "$.metadata.name", "$.name", "$.owner.rid"],
+        )
 
         def name_of(obj: dict[str, Any]) -> str:
             md = obj.get("metadata")
@@ -744,7 +770,7 @@ class V2Dispatcher:
 
         rooms: list[dict[str, Any]] = []
         device_to_room: dict[str, str] = {}
-        for r in rooms_raw:
+        async for r in self.db.iter_resources(rtype="room"):
             rid = r.get("id")
             if not isinstance(rid, str):
                 continue
@@ -766,28 +792,31 @@ class V2Dispatcher:
 
         light_to_room: dict[str, str] = {}
         lights: list[dict[str, Any]] = []
-        for l in lights_raw:
-            rid = l.get("id")
+        for rid, md_name, plain_name, owner_rid in lights_raw:
             if not isinstance(rid, str):
                 continue
-            owner = l.get("owner")
-            owner_rid = ""
-            if isinstance(owner, dict) and isinstance(owner.get("rid"), str):
-                owner_rid = owner["rid"]
+            if not isinstance(owner_rid, str):
+                owner_rid = ""
             room_rid = device_to_room.get(owner_rid)
             if room_rid:
                 light_to_room[rid] = room_rid
+            if isinstance(md_name, str):
+                light_name = md_name
+            elif isinstance(plain_name, str):
+                light_name = plain_name
+            else:
+                light_name = ""
             lights.append(
                 {
                     "rid": rid,
-                    "name": name_of(l),
+                    "name": light_name,
                     "ownerDeviceRid": owner_rid,
                     "roomRid": room_rid,
                 }
             )
 
         zones: list[dict[str, Any]] = []
-        for z in zones_raw:
+        async for z in self.db.iter_resources(rtype="zone"):
             rid = z.get("id")
             if not isinstance(rid, str):
                 continue
@@ -22,8 +22,9 @@ class V2EventBus:
     def __init__(self, *, replay_maxlen: int = 500) -> None:
         self._cursor = 0
         self._replay: deque[V2EventItem] = deque(maxlen=max(1, int(replay_maxlen)))
-        self._subscribers: set[asyncio.Queue[V2EventItem]] = set()
-        self._lock = asyncio.Lock()
+        # Copy-on-write tuple; none of the methods below await while touching shared state,
+        # so the event loop already serializes them and no lock is needed.
+        self._subscribers: tuple[asyncio.Queue[V2EventItem], ...] = ()
 
     @property
     def cursor(self) -> int:
@@ -31,23 +32,19 @@ class V2EventBus:
 
     async def subscribe(self) -> V2Subscription:
         queue: asyncio.Queue[V2EventItem] = asyncio.Queue(maxsize=200)
-        async with self._lock:
-            self._subscribers.add(queue)
+        self._subscribers = self._subscribers + (queue,)
 
         async def _unsubscribe() -> None:
-            async with self._lock:
-                self._subscribers.discard(queue)
+            self._subscribers = tuple(q for q in self._subscribers if q is not queue)
 
         return V2Subscription(queue=queue, unsubscribe=_unsubscribe)
 
     async def publish(self, event: dict[str, Any]) -> V2EventItem:
-        async with self._lock:
-            self._cursor += 1
-            item = V2EventItem(cursor=self._cursor, event=event)
-            self._replay.append(item)
-            subscribers = list(self._subscribers)
+        self._cursor += 1
+        item = V2EventItem(cursor=self._cursor, event=event)
+        self._replay.append(item)
 
-        for q in subscribers:
+        for q in self._subscribers:
             if q.full():
                 try:
                     q.get_nowait()
@@ -60,9 +57,8 @@ class V2EventBus:
         return item
 
     async def allocate_cursor(self) -> int:
-        async with self._lock:
-            self._cursor += 1
-            return self._cursor
+        self._cursor += 1
+        return self._cursor
 
     async def replay_from(self, last_cursor: int) -> list[V2EventItem] | None:
         """
@@ -70,8 +66,7 @@ class V2EventBus:
         If last_cursor is too old (not in buffer) but buffer is non-empty, return None.
         If buffer is empty, return [].
         """
-        async with self._lock:
-            items = list(self._replay)
+        items = list(self._replay)
 
         if not items:
             return None if last_cursor > 0 else []
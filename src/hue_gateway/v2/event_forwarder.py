@@ -44,7 +44,7 @@ async def forward_v1_to_v2_loop(*, db: Database, cache: ResourceCache, hub: Even
     subscription = await hub.subscribe()
     try:
         while True:
-            event = await subscription.queue.get()
+            event = (await subscription.queue.get()).data
             revision = await db.get_setting_int("inventory_revision", default=0)
 
             resource = event.get("resource")
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import time
@@ -39,16 +40,19 @@ class IdempotencyRecord:
 
 
 async def get_record(*, db: Database, credential_fp: str, key: str) -> IdempotencyRecord | None:
-    async with db.conn.execute(
-        """
-        SELECT credential_fingerprint, idempotency_key, action, request_hash, status,
-               response_status_code, response_json, created_at, updated_at, expires_at
-        FROM idempotency
-        WHERE credential_fingerprint = ? AND idempotency_key = ?
-        """,
-        (credential_fp, key),
-    ) as cursor:
-        row = await cursor.fetchone()
+    # The writer connection can hold another task's uncommitted rows; reading inside
+    # transaction() (a savepoint when the caller already holds one) only sees settled data.
+    async with db.transaction():
+        async with db.conn.execute(
+            """
+            SELECT credential_fingerprint, idempotency_key, action, request_hash, status,
+                   response_status_code, response_json, created_at, updated_at, expires_at
+            FROM idempotency
+            WHERE credential_fingerprint = ? AND idempotency_key = ?
+            """,
+            (credential_fp, key),
+        ) as cursor:
+            row = await cursor.fetchone()
     if not row:
         return None
     return IdempotencyRecord(
@@ -76,18 +80,18 @@ async def mark_in_progress(
 ) -> tuple[IdempotencyRecord, bool]:
     now = int(time.time())
     expires_at = now + max(1, int(ttl_seconds))
-    cur = await db.conn.execute(
-        """
-        INSERT OR IGNORE INTO idempotency (
-          credential_fingerprint, idempotency_key, action, request_hash, status,
-          response_status_code, response_json, created_at, updated_at, expires_at
-        ) VALUES (?, ?, ?, ?, ?, NULL, NULL, ?, ?, ?)
-        """,
-        (credential_fp, key, action, req_hash, "in_progress", now, now, expires_at),
-    )
-    inserted = cur.rowcount == 1
-    await db.commit()
-    rec = await get_record(db=db, credential_fp=credential_fp, key=key)
+    async with db.transaction():
+        cur = await db.conn.execute(
+            """
+            INSERT OR IGNORE INTO idempotency (
+              credential_fingerprint, idempotency_key, action, request_hash, status,
+              response_status_code, response_json, created_at, updated_at, expires_at
+            ) VALUES (?, ?, ?, ?, ?, NULL, NULL, ?, ?, ?)
+            """,
+            (credential_fp, key, action, req_hash, "in_progress", now, now, expires_at),
+        )
+        inserted = cur.rowcount == 1
+        rec = await get_record(db=db, credential_fp=credential_fp, key=key)
     if not rec:
         # Should never happen, but fail safe by returning an in-progress record.
         return (
@@ -122,44 +126,44 @@ async def mark_completed(
     now = int(time.time())
     expires_at = now + max(1, int(ttl_seconds))
     response_json = json.dumps(response_obj, separators=(",", ":"), ensure_ascii=False)
-    await db.conn.execute(
-        """
-        UPDATE idempotency
-        SET action = ?, request_hash = ?, status = ?,
-            response_status_code = ?, response_json = ?, updated_at = ?, expires_at = ?
-        WHERE credential_fingerprint = ? AND idempotency_key = ?
-        """,
-        (action, req_hash, "completed", int(status_code), response_json, now, expires_at, credential_fp, key),
-    )
-    await db.commit()
+    async with db.transaction():
+        await db.conn.execute(
+            """
+            UPDATE idempotency
+            SET action = ?, request_hash = ?, status = ?,
+                response_status_code = ?, response_json = ?, updated_at = ?, expires_at = ?
+            WHERE credential_fingerprint = ? AND idempotency_key = ?
+            """,
+            (action, req_hash, "completed", int(status_code), response_json, now, expires_at, credential_fp, key),
+        )
 
 
 async def cleanup_expired(*, db: Database, max_rows: int = 5000) -> int:
     now = int(time.time())
-    # Delete expired rows first.
-    cur = await db.conn.execute("DELETE FROM idempotency WHERE expires_at <= ?", (now,))
-    deleted = cur.rowcount if cur.rowcount is not None else 0
-
-    # Hard cap: delete oldest rows beyond max_rows.
-    async with db.conn.execute("SELECT COUNT(*) FROM idempotency") as cursor:
-        row = await cursor.fetchone()
-    count = int(row[0]) if row and row[0] is not None else 0
-    if count > max_rows:
-        to_delete = count - max_rows
-        await db.conn.execute(
-            """
-            DELETE FROM idempotency
-            WHERE rowid IN (
-              SELECT rowid FROM idempotency
-              ORDER BY updated_at ASC
-              LIMIT ?
+    async with db.transaction():
+        # Delete expired rows first.
+        cur = await db.conn.execute("DELETE FROM idempotency WHERE expires_at <= ?", (now,))
+        deleted = cur.rowcount if cur.rowcount is not None else 0
+
+        # Hard cap: delete oldest rows beyond max_rows.
+        async with db.conn.execute("SELECT COUNT(*) FROM idempotency") as cursor:
+            row = await cursor.fetchone()
+        count = int(row[0]) if row and row[0] is not None else 0
+        if count > max_rows:
+            to_delete = count - max_rows
+            await db.conn.execute(
+                """
+                DELETE FROM idempotency
+                WHERE rowid IN (
+                  SELECT rowid FROM idempotency
+                  ORDER BY updated_at ASC
+                  LIMIT ?
+                )
+                """,
+                (to_delete,),
             )
-            """,
-            (to_delete,),
-        )
-        deleted += to_delete
+            deleted += to_delete
 
-    await db.commit()
     return deleted
 
 
@@ -174,6 +178,4 @@ async def cleanup_loop(*, db: Database, interval_seconds: int = 60) -> None:
 
 
 async def time_sleep(seconds: int) -> None:
-    import asyncio
-
     await asyncio.sleep(max(1, int(seconds)))
@@ -6,9 +6,10 @@ import time
 from typing import Any
 
 from fastapi import APIRouter, Body, Request, status
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import StreamingResponse
 
 from hue_gateway.rate_limit import TokenBucketLimiter
+from hue_gateway.responses import ORJSONResponse
 from hue_gateway.v2.dispatcher import V2Dispatcher
 from hue_gateway.v2.schemas import (
     V2ActionError,
@@ -31,7 +32,7 @@ def _err(
     code: str,
     message: str,
     details: dict[str, Any] | None = None,
-) -> JSONResponse:
+) -> ORJSONResponse:
     body = V2ErrorEnvelope(
         requestId=request_id,
         action=action,
@@ -41,7 +42,7 @@ def _err(
     headers = {}
     if x_request_id:
         headers["X-Request-Id"] = x_request_id
-    return JSONResponse(body, status_code=status_code, headers=headers)
+    return ORJSONResponse(body, status_code=status_code, headers=headers)
 
 
 @router.post(
@@ -119,12 +120,19 @@ async def v2_actions(request: Request, payload: V2ActionRequest = Body(...)):
                 details={"retryAfterMs": retry_after_ms},
             ),
         ).model_dump(mode="json")
-        return JSONResponse(body, status_code=status.HTTP_429_TOO_MANY_REQUESTS, headers=headers)
+        return ORJSONResponse(body, status_code=status.HTTP_429_TOO_MANY_REQUESTS, headers=headers)
 
     action = payload.action
     request_id = effective_request_id
 
-    v2_dispatcher = V2Dispatcher(db=state.db, hue=state.hue, cache=state.cache, config=state.config)
+    v2_dispatcher = V2Dispatcher(
+        db=state.db,
+        hue=state.hue,
+        cache=state.cache,
+        config=state.config,
+        config_changed=state.config_changed,
+        invalidate_name_cache=state.dispatcher.invalidate_name_cache,
+    )
     resp = await v2_dispatcher.dispatch(
         payload=payload,
         auth=auth,
@@ -136,7 +144,7 @@ async def v2_actions(request: Request, payload: V2ActionRequest = Body(...)):
         headers["X-Request-Id"] = x_request_id
     if resp.headers:
         headers.update(resp.headers)
-    return JSONResponse(resp.body, status_code=resp.status_code, headers=headers or None)
+    return ORJSONResponse(resp.body, status_code=resp.status_code, headers=headers or None)
 
 
 @router.get(
@@ -5,6 +5,8 @@ from typing import Annotated, Any, Literal, Union
 
 from pydantic import BaseModel, Field
 
+from hue_gateway.schemas import ClipV2Body
+
 
 class V2ActionError(BaseModel):
     code: str
@@ -101,7 +103,7 @@ class V2BridgePairSuccess(BaseModel):
 class V2ClipV2RequestArgs(BaseModel):
     method: Literal["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"]
     path: str = Field(..., pattern=r"^/clip/v2/.*")
-    body: dict[str, Any] | list[Any] | None = None
+    body: ClipV2Body = None
 
 
 class V2ClipV2Request(_V2BaseRequest):
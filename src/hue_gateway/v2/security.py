@@ -1,17 +1,8 @@
 from __future__ import annotations
 
-import secrets
-
 from fastapi import Request
 
-from hue_gateway.security import AuthContext
-
-
-def _is_allowed(value: str, allowed: list[str]) -> bool:
-    for item in allowed:
-        if secrets.compare_digest(value, item):
-            return True
-    return False
+from hue_gateway.security import AuthContext, _authenticate
 
 
 def authenticate_v2(request: Request) -> AuthContext | None:
@@ -21,14 +12,18 @@ def authenticate_v2(request: Request) -> AuthContext | None:
     authz = request.headers.get("authorization", "")
     if authz.lower().startswith("bearer "):
         token = authz[len("bearer ") :].strip()
-        if token and _is_allowed(token, config.auth_tokens):
-            return AuthContext(credential=token, scheme="bearer")
+        if token:
+            auth = _authenticate(config, token, "bearer")
+            if auth is not None:
+                return auth
 
     api_key = request.headers.get("x-api-key")
     if api_key:
         api_key = api_key.strip()
-        if api_key and _is_allowed(api_key, config.api_keys):
-            return AuthContext(credential=api_key, scheme="api_key")
+        if api_key:
+            auth = _authenticate(config, api_key, "api_key")
+            if auth is not None:
+                return auth
 
     return None
 
@@ -0,0 +1,194 @@
+import asyncio
+import json
+import sqlite3
+
+import pytest
+
+from hue_gateway.db import Database
+
+
+@pytest.mark.asyncio
+async def test_file_db_reads_committed_writes_through_reader_connections(tmp_path):
+    db = Database(str(tmp_path / "gateway.db"), readers=2)
+    await db.connect()
+    try:
+        assert db.reader is not db.conn
+
+        await db.set_setting("bridge_host", "192.168.1.29")
+        assert await db.get_setting("bridge_host") == "192.168.1.29"
+
+        await db.upsert_resource(rid="1", rtype="light", name="Kitchen", json_text=json.dumps({"id": "1"}))
+        await db.commit()
+        await db.rebuild_name_index()
+        assert await db.get_resource("1") == {"id": "1"}
+        assert await db.list_name_candidates(rtype="light") == [("kitchen", "1", "Kitchen")]
+
+        with pytest.raises(Exception):
+            await db.reader.execute("DELETE FROM settings")
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_memory_db_reads_from_the_writer():
+    db = Database(":memory:", readers=2)
+    await db.connect()
+    try:
+        assert db.reader is db.conn
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_transaction_commits_once_and_rolls_back_on_error(tmp_path):
+    db = Database(str(tmp_path / "gateway.db"))
+    await db.connect()
+    try:
+        async with db.transaction():
+            await db.upsert_resource(rid="1", rtype="light", name="Kitchen", json_text=json.dumps({"id": "1"}))
+        assert await db.get_resource("1") == {"id": "1"}
+
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                await db.delete_resource("1")
+                raise RuntimeError("boom")
+        assert await db.get_resource("1") == {"id": "1"}
+        assert await db.list_name_candidates(rtype="light") == [("kitchen", "1", "Kitchen")]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_list_resource_fields_projects_scalars_and_skips_non_objects():
+    db = Database(":memory:")
+    await db.connect()
+    try:
+        await db.upsert_resource(
+            rid="1",
+            rtype="light",
+            name="Lamp",
+            json_text=json.dumps({"id": "1", "metadata": {"name": "Lamp"}, "owner": {"rid": "dev-1"}}),
+        )
+        await db.upsert_resource(rid="2", rtype="light", name=None, json_text=json.dumps({"id": "2", "metadata": {}}))
+        await db.upsert_resource(rid="3", rtype="light", name=None, json_text="not json")
+        await db.upsert_resource(rid="4", rtype="light", name=None, json_text="[1, 2]")
+        await db.commit()
+
+        rows = await db.list_resource_fields(rtype="light", paths=["$.id", "$.metadata", "$.owner.rid"])
+        assert sorted(rows) == [("1", None, "dev-1"), ("2", None, None)]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_upsert_keeps_name_candidates_current(tmp_path):
+    db = Database(str(tmp_path / "gateway.db"))
+    await db.connect()
+    try:
+        await db.upsert_resource(rid="1", rtype="light", name="  Living   ROOM ", json_text="{}")
+        await db.upsert_resource(rid="2", rtype="light", name="   ", json_text="{}")
+        await db.upsert_resource(rid="3", rtype="scene", name="Relax", json_text="{}")
+        await db.commit()
+        assert await db.list_name_candidates(rtype="light") == [("living room", "1", "  Living   ROOM ")]
+
+        await db.upsert_resource(rid="1", rtype="light", name="Den", json_text="{}")
+        await db.commit()
+        assert await db.list_name_candidates(rtype="light") == [("den", "1", "Den")]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_backfills_name_norm_for_older_schema(tmp_path):
+    path = str(tmp_path / "gateway.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(
+        """
+        CREATE TABLE resources (rid TEXT PRIMARY KEY, rtype TEXT NOT NULL, name TEXT, json BLOB NOT NULL, updated_at INTEGER NOT NULL);
+        CREATE TABLE name_index (rtype TEXT NOT NULL, name_norm TEXT NOT NULL, rid TEXT NOT NULL);
+        INSERT INTO resources VALUES ('1', 'light', 'Kitchen  Lamp', '{}', 0);
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    db = Database(path)
+    await db.connect()
+    try:
+        assert await db.list_name_candidates(rtype="light") == [("kitchen lamp", "1", "Kitchen  Lamp")]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_upsert_resources_writes_batch_in_one_commit(tmp_path):
+    db = Database(str(tmp_path / "gateway.db"))
+    await db.connect()
+    try:
+        await db.upsert_resources(
+            [
+                ("1", "light", "Kitchen", json.dumps({"id": "1"})),
+                ("2", "scene", None, json.dumps({"id": "2"})),
+                ("1", "light", "Pantry", json.dumps({"id": "1", "v": 2})),
+            ]
+        )
+        assert not db.conn.in_transaction
+        assert await db.get_resource("1") == {"id": "1", "v": 2}
+        assert await db.get_resource("2") == {"id": "2"}
+        assert await db.list_name_candidates(rtype="light") == [("pantry", "1", "Pantry")]
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_nested_transaction_rolls_back_with_the_outer_block(tmp_path):
+    db = Database(str(tmp_path / "gateway.db"))
+    await db.connect()
+    try:
+        with pytest.raises(RuntimeError):
+            async with db.transaction():
+                await db.upsert_resources([("1", "light", "Kitchen", json.dumps({"id": "1"}))])
+                await db.set_setting("bridge_host", "192.168.1.29")
+                raise RuntimeError("boom")
+        assert await db.get_resource("1") is None
+        assert await db.get_setting("bridge_host") is None
+
+        async with db.transaction():
+            with pytest.raises(RuntimeError):
+                async with db.transaction():
+                    await db.upsert_resource(rid="2", rtype="light", name=None, json_text="{}")
+                    raise RuntimeError("boom")
+            await db.upsert_resource(rid="3", rtype="light", name=None, json_text="{}")
+        assert await db.get_resource("2") is None
+        assert await db.get_resource("3") == {}
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writer_waits_for_open_transaction(tmp_path):
+    db = Database(str(tmp_path / "gateway.db"))
+    await db.connect()
+    entered = asyncio.Event()
+
+    async def _batch():
+        async with db.transaction():
+            await db.upsert_resource(rid="c", rtype="light", name=None, json_text="{}")
+            entered.set()
+            await asyncio.sleep(3600)
+
+    try:
+        batch = asyncio.create_task(_batch())
+        await entered.wait()
+        setting = asyncio.create_task(db.set_setting("bridge_host", "192.168.1.29"))
+        await asyncio.sleep(0.05)
+        assert not setting.done()
+
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+        await setting
+        assert await db.get_setting("bridge_host") == "192.168.1.29"
+        assert await db.get_resource("c") is None
+    finally:
+        await db.close()
@@ -1,4 +1,5 @@
 from hue_gateway.discover_tool import (
+    _SSDPProtocol,
     _extract_upnp_fields,
     _ip_from_location,
     _looks_like_hue_description,
@@ -61,3 +62,15 @@ def test_extract_upnp_fields_parses_default_namespace():
     assert fields["friendly_name"] == "Hue Bridge (192.168.1.29)"
     assert fields["model"] == "Philips hue bridge 2015"
     assert fields["udn"] == "uuid:abc"
+
+
+def test_ssdp_protocol_collects_only_bridge_responses():
+    proto = _SSDPProtocol()
+    proto.datagram_received(
+        b"HTTP/1.1 200 OK\r\nSERVER: Linux/3.14 UPnP/1.0 IpBridge/1.60\r\n"
+        b"LOCATION: http://192.168.1.2:80/description.xml\r\n\r\n",
+        ("192.168.1.2", 1900),
+    )
+    proto.datagram_received(b"HTTP/1.1 200 OK\r\nSERVER: SomeTV/1.0\r\n\r\n", ("192.168.1.3", 1900))
+    assert list(proto.found) == ["192.168.1.2"]
+    assert proto.found["192.168.1.2"].location == "http://192.168.1.2:80/description.xml"
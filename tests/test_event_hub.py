@@ -0,0 +1,46 @@
+import pytest
+
+from hue_gateway.event_hub import EventHub
+
+
+@pytest.mark.asyncio
+async def test_event_hub_drops_oldest_and_counts_for_slow_subscriber():
+    hub = EventHub(max_queue_size=2)
+    subscription = await hub.subscribe()
+    try:
+        for i in range(5):
+            await hub.publish({"n": i})
+
+        assert subscription.dropped == 3
+        assert subscription.queue.get_nowait().data == {"n": 3}
+        last = subscription.queue.get_nowait()
+        assert last.data == {"n": 4}
+        assert last.frame == b'data: {"n":4}\n\n'
+        assert last.frame is last.frame
+    finally:
+        await subscription.unsubscribe()
+
+    await hub.publish({"n": 5})
+    assert subscription.queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_event_hub_disconnects_subscriber_that_stays_full():
+    hub = EventHub(max_queue_size=2)
+    slow = await hub.subscribe(disconnect_when_slow=True)
+    steady = await hub.subscribe()
+    try:
+        for i in range(7):
+            await hub.publish({"n": i})
+
+        assert slow.closed is True
+        assert slow.dropped == 5
+        assert [slow.queue.get_nowait().data["n"] for _ in range(2)] == [4, 5]
+
+        await hub.publish({"n": 7})
+        assert slow.queue.empty()
+        assert steady.closed is False
+        assert steady.queue.get_nowait().data == {"n": 6}
+    finally:
+        await slow.unsubscribe()
+        await steady.unsubscribe()
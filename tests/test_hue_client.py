@@ -82,3 +82,93 @@ async def test_hue_client_raises_transport_error_on_connect_failure():
             await client.request_jsonish(method="GET", path="/clip/v2/resource/bridge")
     finally:
         await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hue_client_configure_keeps_pool_unless_changed_and_closes_replaced_client():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"host": request.url.host})
+
+    client = HueClient(
+        bridge_host="bridge.test",
+        application_key="abc",
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        await client.request_jsonish(method="GET", path="/clip/v2/resource/bridge")
+        first = await client._get_client()
+
+        client.configure(bridge_host="bridge.test", application_key="abc")
+        assert await client._get_client() is first
+
+        client.configure(bridge_host="other.test", application_key="abc")
+        result = await client.request_jsonish(method="GET", path="/clip/v2/resource/bridge")
+        assert result.body == {"host": "other.test"}
+        assert first.is_closed
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_hue_client_stream_sse_json_reassembles_events_across_chunks():
+    chunks = [
+        b": hi\n\nid: 1\ndata: [{\"type\":",
+        b"\"update\"}]\r\n\r\ndata: not json\n\n",
+        b"data: {\"a\":\ndata: 1}\n",
+        b"\n",
+    ]
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers.get("accept") == "text/event-stream"
+        return httpx.Response(200, content=body())
+
+    client = HueClient(
+        bridge_host="bridge.test",
+        application_key="abc",
+        transport=httpx.MockTransport(handler),
+    )
+    try:
+        events = [obj async for obj in client.stream_sse_json("/eventstream/clip/v2")]
+        assert events == [[{"type": "update"}], {"a": 1}]
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_iter_sse_data_accepts_bare_cr_line_endings():
+    from hue_gateway import hue_client
+
+    # Bare CR terminators, plus a CRLF whose LF arrives in the next chunk.
+    chunks = [b"data: [1]\r\rdata: [2]\r", b"\n\r", b"\ndata: [3]\r", b"\r"]
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    events = [bytes(payload) async for payload in hue_client._iter_sse_data(body())]
+    assert events == [b"[1]", b"[2]", b"[3]"]
+
+
+@pytest.mark.asyncio
+async def test_iter_sse_data_drops_events_over_the_size_cap(monkeypatch):
+    from hue_gateway import hue_client
+
+    monkeypatch.setattr(hue_client, "_SSE_MAX_EVENT_BYTES", 16)
+    chunks = [
+        b"data: [1]\n\n",
+        b"data: 0123456789\ndata: 0123456789\n\n",
+        b"data: " + b"x" * 20,
+        b"x" * 20 + b"\ndata: [2]\n\n",
+        b"data: [3]\n\n",
+    ]
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    events = [bytes(payload) async for payload in hue_client._iter_sse_data(body())]
+    assert events == [b"[1]", b"[3]"]
@@ -0,0 +1,48 @@
+import pytest
+
+from hue_gateway.cache import ResourceCache
+from hue_gateway.db import Database
+from hue_gateway.hue_client import HueUpstreamError
+from hue_gateway.hue_sync import sync_core_resources
+
+
+class _FakeHue:
+    def __init__(self, failing: set[str]) -> None:
+        self.failing = failing
+
+    async def get_json(self, path: str):
+        rtype = path.rsplit("/", 1)[-1]
+        if rtype in self.failing:
+            raise HueUpstreamError(status_code=503, body="")
+        return {"data": [{"id": f"{rtype}-1", "type": rtype, "metadata": {"name": rtype.title()}}]}
+
+
+@pytest.mark.asyncio
+async def test_sync_core_resources_stores_types_that_succeeded_then_raises():
+    db = Database(":memory:")
+    await db.connect()
+    cache = ResourceCache()
+    try:
+        with pytest.raises(HueUpstreamError):
+            await sync_core_resources(db=db, hue=_FakeHue({"scene"}), cache=cache)  # type: ignore[arg-type]
+
+        assert await db.get_resource("light-1") is not None
+        assert await db.get_resource("scene-1") is None
+        assert cache.get("light-1") is not None
+        assert await db.get_setting_int("inventory_revision") == 1
+    finally:
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_sync_core_resources_writes_nothing_when_every_type_fails():
+    from hue_gateway.hue_sync import CORE_RESOURCE_TYPES
+
+    db = Database(":memory:")
+    await db.connect()
+    try:
+        with pytest.raises(HueUpstreamError):
+            await sync_core_resources(db=db, hue=_FakeHue(set(CORE_RESOURCE_TYPES)), cache=ResourceCache())  # type: ignore[arg-type]
+        assert await db.get_setting_int("inventory_revision") == 0
+    finally:
+        await db.close()
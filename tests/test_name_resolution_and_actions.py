@@ -91,3 +91,131 @@ async def test_light_set_resolves_by_name_and_calls_bridge_put(config):
         await hue.close()
         await db.close()
 
+
+
+@pytest.mark.asyncio
+async def test_resolve_by_name_reuses_cached_candidates(config):
+    db = Database(":memory:")
+    await db.connect()
+    await db.upsert_resource(rid="1", rtype="light", name="Desk", json_text=json.dumps({"id": "1"}))
+    await db.commit()
+    await db.rebuild_name_index()
+
+    calls = 0
+    original = db.list_name_candidates
+
+    async def counting_list_name_candidates(*, rtype: str):
+        nonlocal calls
+        calls += 1
+        return await original(rtype=rtype)
+
+    db.list_name_candidates = counting_list_name_candidates  # type: ignore[method-assign]
+
+    hue = HueClient(bridge_host="bridge.test", application_key="k", transport=httpx.MockTransport(lambda r: None))  # type: ignore[arg-type]
+    dispatcher = ActionDispatcher(db=db, hue=hue, config=config)
+    payload = {"action": "resolve.by_name", "args": {"rtype": "light", "name": "desk"}}
+    auth = AuthContext(credential="dev", scheme="bearer")
+    try:
+        assert (await dispatcher.dispatch(payload=payload, auth=auth)).status_code == 200
+        assert (await dispatcher.dispatch(payload=payload, auth=auth)).status_code == 200
+        assert calls == 1
+
+        dispatcher.invalidate_name_cache()
+        assert (await dispatcher.dispatch(payload=payload, auth=auth)).status_code == 200
+        assert calls == 2
+    finally:
+        await hue.close()
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_v2_bridge_set_host_invalidates_v1_name_caches(config):
+    from hue_gateway.v2.dispatcher import V2Dispatcher
+    from hue_gateway.v2.schemas import V2BridgeSetHostRequest
+
+    db = Database(":memory:")
+    await db.connect()
+    await db.upsert_resource(rid="1", rtype="light", name="Desk", json_text=json.dumps({"id": "1"}))
+    await db.commit()
+
+    hue = HueClient(bridge_host="bridge.test", application_key="k", transport=httpx.MockTransport(lambda r: None))  # type: ignore[arg-type]
+    dispatcher = ActionDispatcher(db=db, hue=hue, config=config)
+    v2 = V2Dispatcher(db=db, hue=hue, cache=None, config=config, invalidate_name_cache=dispatcher.invalidate_name_cache)
+    payload = {"action": "resolve.by_name", "args": {"rtype": "light", "name": "desk"}}
+    auth = AuthContext(credential="dev", scheme="bearer")
+    try:
+        assert (await dispatcher.dispatch(payload=payload, auth=auth)).body["result"]["matched"]["rid"] == "1"
+
+        # The new bridge's inventory replaces the old one; v1 must not keep serving the cached rid.
+        await db.delete_resource("1")
+        await db.upsert_resource(rid="9", rtype="light", name="Desk", json_text=json.dumps({"id": "9"}))
+        await db.commit()
+        request = V2BridgeSetHostRequest(action="bridge.set_host", args={"bridgeHost": "192.168.1.30"})
+        resp = await v2.dispatch(payload=request, auth=auth, request_id=None, idempotency_key=None)
+        assert resp.status_code == 200
+
+        assert (await dispatcher.dispatch(payload=payload, auth=auth)).body["result"]["matched"]["rid"] == "9"
+    finally:
+        await hue.close()
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_v2_bridge_pair_invalidates_v1_resolve_cache(config):
+    from hue_gateway.v2.dispatcher import V2Dispatcher
+    from hue_gateway.v2.schemas import V2BridgePairRequest
+
+    db = Database(":memory:")
+    await db.connect()
+    await db.upsert_resource(rid="1", rtype="light", name="Desk", json_text=json.dumps({"id": "1"}))
+    await db.commit()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[{"success": {"username": "new-key"}}])
+
+    hue = HueClient(bridge_host="bridge.test", application_key="k", transport=httpx.MockTransport(handler))
+    dispatcher = ActionDispatcher(db=db, hue=hue, config=config)
+    v2 = V2Dispatcher(db=db, hue=hue, cache=None, config=config, invalidate_name_cache=dispatcher.invalidate_name_cache)
+    auth = AuthContext(credential="dev", scheme="bearer")
+    try:
+        await dispatcher.dispatch(payload={"action": "resolve.by_name", "args": {"rtype": "light", "name": "desk"}}, auth=auth)
+        assert dispatcher._resolve_cache
+
+        request = V2BridgePairRequest(action="bridge.pair")
+        resp = await v2.dispatch(payload=request, auth=auth, request_id=None, idempotency_key=None)
+        assert resp.status_code == 200
+        assert not dispatcher._resolve_cache
+    finally:
+        await hue.close()
+        await db.close()
+
+
+@pytest.mark.asyncio
+async def test_resolve_by_name_exact_duplicate_names_are_ambiguous(config):
+    db = Database(":memory:")
+    await db.connect()
+    await db.upsert_resource(rid="1", rtype="light", name="Desk", json_text=json.dumps({"id": "1"}))
+    await db.upsert_resource(rid="2", rtype="light", name="desk", json_text=json.dumps({"id": "2"}))
+    await db.upsert_resource(rid="3", rtype="light", name="Hall", json_text=json.dumps({"id": "3"}))
+    await db.commit()
+    await db.rebuild_name_index()
+
+    hue = HueClient(bridge_host="bridge.test", application_key="k", transport=httpx.MockTransport(lambda r: None))  # type: ignore[arg-type]
+    dispatcher = ActionDispatcher(db=db, hue=hue, config=config)
+    auth = AuthContext(credential="dev", scheme="bearer")
+    try:
+        resp = await dispatcher.dispatch(
+            payload={"action": "resolve.by_name", "args": {"rtype": "light", "name": " HALL "}}, auth=auth
+        )
+        assert resp.status_code == 200
+        assert resp.body["result"] == {"matched": {"rid": "3", "rtype": "light", "name": "Hall"}, "confidence": 1.0}
+
+        resp = await dispatcher.dispatch(
+            payload={"action": "resolve.by_name", "args": {"rtype": "light", "name": "Desk"}}, auth=auth
+        )
+        assert resp.status_code == 409
+        assert resp.body["error"]["code"] == "ambiguous_name"
+        assert {c["rid"] for c in resp.body["error"]["details"]["candidates"]} == {"1", "2"}
+    finally:
+        await hue.close()
+        await db.close()
@@ -0,0 +1,29 @@
+from hue_gateway import rate_limit
+from hue_gateway.rate_limit import TokenBucketLimiter
+
+
+def test_token_bucket_refills_and_reports_retry_after(monkeypatch):
+    now = [1_000_000_000_000]
+    monkeypatch.setattr(rate_limit.time, "monotonic_ns", lambda: now[0])
+    limiter = TokenBucketLimiter(rate_per_sec=2.0, burst=2)
+
+    assert limiter.allow_with_retry_after_ms("a") == (True, 0)
+    assert limiter.allow_with_retry_after_ms("a") == (True, 0)
+    assert limiter.allow_with_retry_after_ms("a") == (False, 501)
+
+    now[0] += 500_000_000
+    assert limiter.allow_with_retry_after_ms("a") == (True, 0)
+    assert limiter.allow("b") is True
+
+
+def test_token_bucket_sweeps_full_buckets_when_keys_pile_up(monkeypatch):
+    now = [1_000_000_000_000]
+    monkeypatch.setattr(rate_limit.time, "monotonic_ns", lambda: now[0])
+    monkeypatch.setattr(rate_limit, "_SWEEP_AT_BUCKETS", 3)
+    limiter = TokenBucketLimiter(rate_per_sec=1.0, burst=1)
+
+    for key in ("a", "b", "c"):
+        assert limiter.allow(key)
+    now[0] += 1_000_000_000
+    assert limiter.allow("d")
+    assert set(limiter._buckets) == {"d"}
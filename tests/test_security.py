@@ -0,0 +1,49 @@
+from hue_gateway.security import AuthContext, _authenticate, _is_allowed
+
+
+def test_is_allowed_matches_exact_credentials_only():
+    allowed = ["dev-token", "other-token"]
+    assert _is_allowed("dev-token", allowed)
+    assert _is_allowed("other-token", allowed)
+    assert not _is_allowed("dev-toke", allowed)
+    assert not _is_allowed("dev-token ", allowed)
+    assert not _is_allowed("dev-token", [])
+
+
+def test_authenticate_caches_accepted_credentials_per_config(config):
+    from dataclasses import replace
+
+    auth = _authenticate(config, "dev-token", "bearer")
+    assert auth == AuthContext(credential="dev-token", scheme="bearer")
+    assert _authenticate(config, "dev-token", "bearer") is auth
+    assert _authenticate(config, "dev-token", "api_key") is None
+    assert _authenticate(config, "dev-key", "api_key") == AuthContext(credential="dev-key", scheme="api_key")
+
+    rotated = replace(config, auth_tokens=["new-token"])
+    assert _authenticate(rotated, "dev-token", "bearer") is None
+    assert _authenticate(rotated, "new-token", "bearer") is not None
+
+
+def test_authenticate_drops_cached_credentials_after_reload(monkeypatch):
+    from hue_gateway.config import AppConfig
+
+    monkeypatch.setenv("GATEWAY_AUTH_TOKENS", "old-token")
+    monkeypatch.setenv("GATEWAY_API_KEYS", "dev-key")
+    assert _authenticate(AppConfig.reload(), "old-token", "bearer") is not None
+
+    monkeypatch.setenv("GATEWAY_AUTH_TOKENS", "new-token")
+    reloaded = AppConfig.reload()
+    assert _authenticate(reloaded, "old-token", "bearer") is None
+    assert _authenticate(reloaded, "new-token", "bearer") is not None
+
+
+def test_authenticate_cache_is_lru_bounded(config, monkeypatch):
+    from dataclasses import replace
+
+    import hue_gateway.security as security
+
+    monkeypatch.setattr(security, "_AUTH_CACHE_MAX", 2)
+    many = replace(config, auth_tokens=["a", "b", "c"])
+    for token in ("a", "b", "a", "c"):
+        assert _authenticate(many, token, "bearer") is not None
+    assert list(security._auth_cache) == [("bearer", "a"), ("bearer", "c")]
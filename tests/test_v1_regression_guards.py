@@ -66,6 +66,40 @@ async def test_v1_actions_shape_failure_dispatcher_error():
             assert isinstance(body["error"]["details"], dict)
 
 
+@pytest.mark.asyncio
+async def test_v1_actions_invalid_body_uses_400_envelope():
+    from hue_gateway.app import app, lifespan
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            headers = {"Authorization": "Bearer dev-token", "Content-Type": "application/json"}
+            resp = await client.post("/v1/actions", headers=headers, content=b'{"action":')
+            assert resp.status_code == 400
+            assert resp.json()["error"]["code"] == "invalid_json"
+
+            resp = await client.post(
+                "/v1/actions",
+                headers=headers,
+                content=json.dumps({"action": "light.set", "args": {"rid": 1}}).encode(),
+            )
+            assert resp.status_code == 400
+            body = resp.json()
+            assert body["error"]["code"] == "invalid_request"
+            assert body["error"]["details"]["errors"][0]["loc"] == ["body", "light.set", "args", "rid"]
+
+            # No Content-Type at all is still read as JSON; a non-JSON type is rejected.
+            raw = json.dumps({"action": "bridge.set_host", "args": {"bridgeHost": "192.168.1.29"}}).encode()
+            resp = await client.post("/v1/actions", headers={"Authorization": "Bearer dev-token"}, content=raw)
+            assert resp.status_code == 200
+            resp = await client.post(
+                "/v1/actions",
+                headers={"Authorization": "Bearer dev-token", "Content-Type": "text/plain"},
+                content=raw,
+            )
+            assert resp.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_v1_events_stream_shape_and_auth():
     from hue_gateway.app import app, lifespan
@@ -92,3 +126,97 @@ async def test_v1_events_stream_shape_and_auth():
         assert first.startswith("data: ")
         payload = first[len("data: ") :].strip()
         assert json.loads(payload) == {"type": "test", "value": 1}
+
+
+@pytest.mark.asyncio
+async def test_v1_events_stream_reports_total_drops_when_disconnecting_slow_client(monkeypatch: pytest.MonkeyPatch):
+    from hue_gateway.app import app, events_stream, lifespan
+    from hue_gateway.security import AuthContext
+
+    monkeypatch.setenv("EVENT_QUEUE_MAX", "2")
+    async with lifespan(app):
+        stream = await events_stream(AuthContext(credential="dev-token", scheme="bearer"))
+        for i in range(7):
+            await app.state.state.hub.publish({"type": "test", "value": i})
+
+        frames = []
+        async for frame in stream.body_iterator:  # type: ignore[attr-defined]
+            frames.append(json.loads(frame[len("data: ") :]))
+        assert frames == [
+            {"type": "overflow", "dropped": 5},
+            {"type": "test", "value": 4},
+            {"type": "test", "value": 5},
+            {"type": "overflow", "dropped": 5},
+        ]
+
+
+@pytest.mark.asyncio
+async def test_v1_light_set_omitted_optional_fields_are_not_sent_as_null():
+    from hue_gateway.app import app, lifespan
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.post(
+                "/v1/actions",
+                headers={"Authorization": "Bearer dev-token"},
+                json={"action": "light.set", "args": {"rid": "1", "brightness": 30}},
+            )
+            # Args validate (no `invalid_on` for the omitted `on`); the call then fails on the unconfigured bridge.
+            assert resp.status_code == 424
+            assert resp.json()["error"]["code"] == "bridge_unreachable"
+
+
+@pytest.mark.asyncio
+async def test_v1_bridge_set_host_reconfigures_without_polling():
+    from hue_gateway.app import app, lifespan
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.post(
+                "/v1/actions",
+                headers={"Authorization": "Bearer dev-token"},
+                json={"action": "bridge.set_host", "args": {"bridgeHost": "192.168.1.29"}},
+            )
+            assert resp.status_code == 200
+
+            # The bootstrap loop wakes on the config-changed event instead of a 2s poll.
+            for _ in range(50):
+                if app.state.state.bridge_host == "192.168.1.29":
+                    break
+                await asyncio.sleep(0.01)
+            assert app.state.state.bridge_host == "192.168.1.29"
+
+
+@pytest.mark.asyncio
+async def test_readyz_bounds_bridge_ping_and_reuses_recent_success(monkeypatch: pytest.MonkeyPatch):
+    import hue_gateway.app as app_module
+    from hue_gateway.app import app, lifespan
+
+    monkeypatch.setattr(app_module, "_READYZ_TIMEOUT_SECONDS", 0.05)
+    calls = 0
+    delay = 1.0
+
+    async def _get_json(path: str):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(delay)
+        return {"data": []}
+
+    async with lifespan(app):
+        await asyncio.sleep(0.05)  # let the bootstrap loop finish its initial pass
+        state = app.state.state
+        state.bridge_host = "192.168.1.29"
+        state.application_key = "k"
+        monkeypatch.setattr(state.dispatcher.hue, "get_json", _get_json)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            resp = await client.get("/readyz")
+            assert resp.status_code == 503
+            assert resp.json()["reason"] == "bridge_unreachable"
+
+            delay = 0.0
+            assert (await client.get("/readyz")).json()["ready"] is True
+            assert (await client.get("/readyz")).json()["ready"] is True
+            assert calls == 2
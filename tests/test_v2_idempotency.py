@@ -111,3 +111,42 @@ async def test_v2_idempotency_in_progress_returns_retry_guidance():
             assert body["error"]["code"] == "idempotency_in_progress"
             assert "retryAfterMs" in body["error"]["details"]
 
+
+
+@pytest.mark.asyncio
+async def test_get_record_does_not_see_another_tasks_uncommitted_row(tmp_path):
+    import asyncio
+
+    from hue_gateway.db import Database
+    from hue_gateway.v2.idempotency import get_record
+
+    db = Database(str(tmp_path / "gateway.db"))
+    await db.connect()
+    entered = asyncio.Event()
+
+    async def _pending_insert():
+        async with db.transaction():
+            await db.conn.execute(
+                """
+                INSERT INTO idempotency (
+                  credential_fingerprint, idempotency_key, action, request_hash, status,
+                  response_status_code, response_json, created_at, updated_at, expires_at
+                ) VALUES ('fp', 'k', 'light.set', 'h', 'in_progress', NULL, NULL, 0, 0, 9999999999)
+                """
+            )
+            entered.set()
+            await asyncio.sleep(3600)
+
+    try:
+        writer = asyncio.create_task(_pending_insert())
+        await entered.wait()
+        read = asyncio.create_task(get_record(db=db, credential_fp="fp", key="k"))
+        await asyncio.sleep(0.05)
+        assert not read.done()
+
+        writer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await writer
+        assert await read is None
+    finally:
+        await db.close()